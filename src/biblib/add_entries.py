@@ -1,34 +1,54 @@
 """Add new bibliography entries from staging files."""
 
-import json
 import logging
+import os
 import re
-import tempfile
+import shutil
+from collections.abc import Generator, Iterable
+from contextlib import contextmanager
+from datetime import datetime
+from itertools import chain
 from pathlib import Path
+from typing import BinaryIO
 
 import bibtexparser
 import msgspec
+from bibtexparser.library import Block
 from bibtexparser.model import Entry
 
 from .config import WorkspaceConfig
 from .exceptions import BackupError, FileOperationError, InvalidDataError
-from .generate import generate_labels
+from .generate import generate_labels_for_entry
 from .types import (
     AddOrderList,
     IdentifierCollection,
     IdentifierData,
     KeyMapping,
 )
-from .validate import extract_citekeys_from_bib, extract_citekeys_from_identifier_collection
 
 logger = logging.getLogger(__name__)
 
+# Typed decoders are compiled once and decode raw bytes in a single pass; staging
+# JSON files share the identifier collection schema
+_ID_COLL_DECODER = msgspec.json.Decoder(dict[str, IdentifierData])
+_ADD_ORDER_DECODER = msgspec.json.Decoder(list[str])
+_ID_KEYS_DECODER = msgspec.json.Decoder(dict[str, msgspec.Raw])
+_ADD_ORDER_KEYS_DECODER = msgspec.json.Decoder(set[str])
+_JSON_ENCODER = msgspec.json.Encoder()
+_WRITE_BUFFER = 1024 * 1024
 
-def create_backup(workspace: Path) -> str:
+
+def _encode_json(data: object) -> bytes:
+    """Encode data as UTF-8 JSON indented like ``json.dump(indent=2, ensure_ascii=False)``."""
+    return msgspec.json.format(_JSON_ENCODER.encode(data), indent=2)
+
+
+def create_backup(workspace: Path, config: WorkspaceConfig | None = None) -> str:
     """Create timestamped backup of core data files.
 
     Args:
         workspace: Path to the workspace directory
+        config: Workspace configuration; derived from ``workspace`` when omitted
 
     Returns:
         Backup directory path
@@ -36,26 +56,25 @@ def create_backup(workspace: Path) -> str:
     Raises:
         BackupError: If backup creation fails
     """
-    import datetime
-
-    timestamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
     backup_dir = workspace / "staging" / f"backup-{timestamp}"
-    config = WorkspaceConfig.from_workspace(workspace)
+    if config is None:
+        config = WorkspaceConfig.from_workspace(workspace)
 
     try:
         backup_dir.mkdir(parents=True, exist_ok=True)
 
-        # Copy core data files using config
-        if config.bib_path.exists():
-            backup_dir.joinpath("library.bib").write_bytes(config.bib_path.read_bytes())
-        if config.identifier_path.exists():
-            backup_dir.joinpath("identifier_collection.json").write_bytes(
-                config.identifier_path.read_bytes()
-            )
-        if config.add_order_path.exists():
-            backup_dir.joinpath("add_order.json").write_bytes(config.add_order_path.read_bytes())
-
-        logger.info(f"Backup created at {backup_dir}")
+        # Copy core data files using config; copyfile uses the kernel's
+        # zero-copy path (sendfile/copy_file_range) where available
+        for source, name in (
+            (config.bib_path, "library.bib"),
+            (config.identifier_path, "identifier_collection.json"),
+            (config.add_order_path, "add_order.json"),
+        ):
+            if source.exists():
+                shutil.copyfile(source, backup_dir / name)
+
+        logger.info("Backup created at %s", backup_dir)
         return str(backup_dir)
 
     except OSError as e:
@@ -64,6 +83,11 @@ def create_backup(workspace: Path) -> str:
 
 # Pattern for staging files: YYYY-MM-DD-<slug>
 STAGING_PATTERN = re.compile(r"^(\d{4}-\d{2}-\d{2}-[a-zA-Z0-9_-]+)\.(bib|json)$")
+_STAGING_SUFFIXES = (".bib", ".json")
+
+# Start of a BibTeX block: @type{key, or @type(key,
+_CITEKEY_PATTERN = re.compile(rb"^[ \t]*@[ \t]*([A-Za-z]+)[ \t]*[{(]\s*([^,\s{}()]+)", re.MULTILINE)
+_NON_ENTRY_TYPES = frozenset({b"string", b"comment", b"preamble"})
 
 
 def find_staging_pairs(staging_dir: Path) -> list[tuple[str, Path, Path]]:
@@ -75,85 +99,174 @@ def find_staging_pairs(staging_dir: Path) -> list[tuple[str, Path, Path]]:
     Returns:
         List of (slug, bib_path, json_path) tuples for matching pairs
     """
-    logger.debug(f"Scanning staging directory: {staging_dir}")
+    logger.debug("Scanning staging directory: %s", staging_dir)
 
     if not staging_dir.exists():
-        logger.warning(f"Staging directory does not exist: {staging_dir}")
+        logger.warning("Staging directory does not exist: %s", staging_dir)
         return []
 
-    # Find all files matching the pattern
-    files_by_slug: dict[str, dict[str, Path]] = {}
+    # Emit a pair as soon as both halves have been seen; unmatched halves wait here
+    bibs: dict[str, Path] = {}
+    jsons: dict[str, Path] = {}
+    pairs: list[tuple[str, Path, Path]] = []
 
-    for file_path in staging_dir.iterdir():
-        if not file_path.is_file():
-            continue
+    # scandir reuses the file type reported by readdir, avoiding a stat per entry
+    with os.scandir(staging_dir) as it:
+        for dir_entry in it:
+            if not dir_entry.is_file():
+                continue
 
-        match = STAGING_PATTERN.match(file_path.name)
-        if not match:
-            logger.debug(f"Skipping file with invalid pattern: {file_path.name}")
-            continue
+            # Cheap suffix check first so most unrelated files never reach the regex engine
+            name = dir_entry.name
+            match = STAGING_PATTERN.fullmatch(name) if name.endswith(_STAGING_SUFFIXES) else None
+            if not match:
+                logger.debug("Skipping file with invalid pattern: %s", name)
+                continue
 
-        slug, extension = match.groups()
+            slug, extension = match.groups()
+            file_path = Path(dir_entry.path)
+
+            if extension == "bib":
+                json_path = jsons.pop(slug, None)
+                if json_path is None:
+                    bibs[slug] = file_path
+                    continue
+                pairs.append((slug, file_path, json_path))
+            else:
+                bib_path = bibs.pop(slug, None)
+                if bib_path is None:
+                    jsons[slug] = file_path
+                    continue
+                pairs.append((slug, bib_path, file_path))
+
+            logger.debug("Found staging pair: %s", slug)
+
+    # Whatever is left never found its partner
+    for slug in bibs:
+        logger.warning("Incomplete staging pair for %s, missing: ['json']", slug)
+    for slug in jsons:
+        logger.warning("Incomplete staging pair for %s, missing: ['bib']", slug)
+
+    logger.info("Found %d complete staging pairs", len(pairs))
+    return pairs
 
-        if slug not in files_by_slug:
-            files_by_slug[slug] = {}
-        files_by_slug[slug][extension] = file_path
 
-    # Find complete pairs (both .bib and .json)
-    pairs: list[tuple[str, Path, Path]] = []
-    for slug, files in files_by_slug.items():
-        if "bib" in files and "json" in files:
-            pairs.append((slug, files["bib"], files["json"]))
-            logger.debug(f"Found staging pair: {slug}")
-        else:
-            missing = [ext for ext in ["bib", "json"] if ext not in files]
-            logger.warning(f"Incomplete staging pair for {slug}, missing: {missing}")
+class _KeysCache(msgspec.Struct, frozen=True, gc=False):
+    """On-disk snapshot of existing citekeys and the file stats they came from."""
 
-    logger.info(f"Found {len(pairs)} complete staging pairs")
-    return pairs
+    stats: list[tuple[int, int] | None]
+    keys: list[str]
+
+
+_KEYS_CACHE_DECODER = msgspec.msgpack.Decoder(_KeysCache)
+_KEYS_CACHE_NAME = "existing_keys.msgpack"
+
+
+def _data_file_stats(config: WorkspaceConfig) -> list[tuple[int, int] | None]:
+    """Return ``(st_mtime_ns, st_size)`` for each data file, or None if it is missing."""
+    stats: list[tuple[int, int] | None] = []
+    for path in (config.bib_path, config.identifier_path, config.add_order_path):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            stats.append(None)
+        else:
+            stats.append((st.st_mtime_ns, st.st_size))
+    return stats
 
 
 def load_existing_keys(config: WorkspaceConfig) -> set[str]:
     """Load all existing citekeys from the three data files.
 
+    The result is cached in ``config.cache_dir`` together with the modification
+    time and size of each data file, and reused while none of them has changed.
+
     Args:
         config: Workspace configuration with file paths
 
     Returns:
         Set of all existing citekeys
     """
-    existing_keys: set[str] = set()
+    cache_path = config.cache_dir / _KEYS_CACHE_NAME
+    stats = _data_file_stats(config)
+
+    try:
+        cached = _KEYS_CACHE_DECODER.decode(cache_path.read_bytes())
+    except FileNotFoundError:
+        pass
+    except (OSError, msgspec.DecodeError) as e:
+        logger.debug("Ignoring unreadable keys cache %s: %s", cache_path, e)
+    else:
+        if cached.stats == stats:
+            logger.debug("Loaded %d existing keys from cache", len(cached.keys))
+            return set(cached.keys)
 
     try:
-        if config.bib_path.exists():
-            existing_keys.update(extract_citekeys_from_bib(config.bib_path))
+        keys = _scan_bib_keys(config.bib_path)
     except OSError as e:
         raise FileOperationError(f"Failed to load keys from {config.bib_path}: {e}") from e
-    except Exception as e:
-        # Catch bibtexparser errors without knowing their exact type
+    except UnicodeDecodeError as e:
         raise InvalidDataError(f"Failed to parse bib file {config.bib_path}: {e}") from e
 
+    # Identifier values are skipped unparsed; only the keys are needed here
+    identifier_keys: dict[str, msgspec.Raw] = {}
+    add_order_keys: set[str] = set()
     try:
         if config.identifier_path.exists():
-            existing_keys.update(
-                extract_citekeys_from_identifier_collection(config.identifier_path)
-            )
-    except (OSError, msgspec.DecodeError, msgspec.ValidationError) as e:
-        raise InvalidDataError(f"Failed to load keys from {config.identifier_path}: {e}") from e
+            identifier_keys = _ID_KEYS_DECODER.decode(config.identifier_path.read_bytes())
+        if config.add_order_path.exists():
+            add_order_keys = _ADD_ORDER_KEYS_DECODER.decode(config.add_order_path.read_bytes())
+    except OSError as e:
+        raise FileOperationError(f"Failed to load keys: {e}") from e
+    except msgspec.DecodeError as e:
+        raise InvalidDataError(f"Invalid data in identifier collection or add order: {e}") from e
+
+    keys.update(identifier_keys, add_order_keys)
+
+    logger.debug("Loaded %d existing keys", len(keys))
+    _store_keys_cache(config, stats, keys)
+    return keys
 
+
+def _scan_bib_keys(bib_path: Path) -> set[str]:
+    """Collect entry citekeys from a .bib file without building the full AST.
+
+    Only the key after each ``@type{`` is read, which is all duplicate
+    detection needs.
+
+    Args:
+        bib_path: Path to the .bib file
+
+    Returns:
+        Set of citekeys; empty if the file does not exist
+    """
     try:
-        if config.add_order_path.exists():
-            with open(config.add_order_path, encoding="utf-8") as f:
-                raw_data = json.load(f)
-                add_order_data = msgspec.convert(raw_data, type=list[str])
-                existing_keys.update(add_order_data)  # No need for str() on strings!
-    except (OSError, json.JSONDecodeError) as e:
-        raise FileOperationError(f"Failed to load keys from {config.add_order_path}: {e}") from e
-    except msgspec.ValidationError as e:
-        raise InvalidDataError(f"Invalid add_order data in {config.add_order_path}: {e}") from e
+        data = bib_path.read_bytes()
+    except FileNotFoundError:
+        return set()
+    return {
+        match.group(2).decode("utf-8")
+        for match in _CITEKEY_PATTERN.finditer(data)
+        if match.group(1).lower() not in _NON_ENTRY_TYPES
+    }
+
+
+def _store_keys_cache(
+    config: WorkspaceConfig, stats: list[tuple[int, int] | None], keys: set[str]
+) -> None:
+    """Write the keys cache; failures only cost a re-parse on the next run.
 
-    logger.debug(f"Loaded {len(existing_keys)} existing keys")
-    return existing_keys
+    Args:
+        config: Workspace configuration with file paths
+        stats: Data file stats the keys correspond to
+        keys: All citekeys present in the data files
+    """
+    cache_path = config.cache_dir / _KEYS_CACHE_NAME
+    try:
+        config.cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(msgspec.msgpack.encode(_KeysCache(stats, sorted(keys))))
+    except OSError as e:
+        logger.debug("Could not write keys cache %s: %s", cache_path, e)
 
 
 def process_staging_entry(
@@ -173,54 +286,50 @@ def process_staging_entry(
         - entry_data: dict of all processed entries with new keys
         - identifier_data: dict of all identifier data with new keys
     """
-    logger.info(f"Processing staging entry: {slug}")
+    logger.info("Processing staging entry: %s", slug)
 
     try:
         # Parse the bib file and extract entry data
-        logger.debug(f"Parsing bib file: {bib_path}")
-        lib = bibtexparser.parse_file(str(bib_path))
+        logger.debug("Parsing bib file: %s", bib_path)
+        lib = bibtexparser.parse_file(bib_path)
 
         if lib.failed_blocks:
-            logger.error(f"Failed to parse {bib_path}: {len(lib.failed_blocks)} failed blocks")
+            logger.error("Failed to parse %s: %d failed blocks", bib_path, len(lib.failed_blocks))
             return None
 
         if len(lib.entries) == 0:
-            logger.error(f"No entries found in {bib_path}")
+            logger.error("No entries found in %s", bib_path)
             return None
 
-        logger.info(f"Found {len(lib.entries)} entries in {bib_path}")
+        logger.info("Found %d entries in %s", len(lib.entries), bib_path)
 
         # Load identifier data
-        logger.debug(f"Loading identifier data: {json_path}")
-        with open(json_path, encoding="utf-8") as f:
-            raw_data = json.load(f)
-            identifier_data = msgspec.convert(raw_data, type=dict[str, IdentifierData])
+        logger.debug("Loading identifier data: %s", json_path)
+        identifier_data = _ID_COLL_DECODER.decode(json_path.read_bytes())
 
         # Initialize result containers
         key_mapping: KeyMapping = {}
         all_entry_data: dict[str, Entry] = {}
         all_identifier_data: dict[str, IdentifierData] = {}
 
-        # Process each entry in the file
         for entry in lib.entries:
             original_key = entry.key
 
+            # Only entries with identifier data can be labelled
             if original_key not in identifier_data:
-                logger.error(f"Entry key '{original_key}' not found in identifier data")
+                logger.error("Entry key '%s' not found in identifier data", original_key)
                 continue
-
-            # Extract the identifier data for this specific entry
             entry_identifier_data: IdentifierData = identifier_data[original_key]
 
-            # Generate new label for this entry
-            new_key = process_single_entry(
-                entry,
-                entry_identifier_data,
-                existing_keys,
-                original_key,
-            )
+            # A label failure skips this entry only, not the rest of the pair
+            try:
+                label = generate_labels_for_entry(entry, entry_identifier_data)
+            except (ValueError, KeyError, TypeError) as e:
+                logger.error("Error generating label for entry %s: %s", original_key, e)
+                continue
+
+            new_key = process_single_entry(entry, label, existing_keys)
             if new_key is None:
-                logger.error(f"Failed to generate label for entry {original_key}")
                 continue
 
             # Store the mapping and data
@@ -230,180 +339,262 @@ def process_staging_entry(
             existing_keys.add(new_key)  # Prevent duplicates within this batch
 
         if not key_mapping:
-            logger.error(f"No entries were successfully processed from {slug}")
+            logger.error("No entries were successfully processed from %s", slug)
             return None
 
-        logger.info(f"Successfully processed {len(key_mapping)} entries from {slug}")
+        logger.info("Successfully processed %d entries from %s", len(key_mapping), slug)
         return key_mapping, all_entry_data, all_identifier_data
 
-    except (OSError, json.JSONDecodeError) as e:
+    except OSError as e:
         raise FileOperationError(f"Failed to read staging files for {slug}: {e}") from e
-    except (msgspec.DecodeError, msgspec.ValidationError) as e:
+    except msgspec.DecodeError as e:
         raise InvalidDataError(f"Invalid data format in staging files for {slug}: {e}") from e
 
 
-def process_single_entry(
-    entry: Entry,
-    entry_identifier_data: IdentifierData,
-    existing_keys: set[str],
-    original_key: str,
-) -> str | None:
-    """Process a single entry and generate its new key.
+def process_single_entry(entry: Entry, new_key: str, existing_keys: set[str]) -> str | None:
+    """Assign a generated key to a single entry unless it is a duplicate.
 
     Args:
-        entry: The bibtex entry to process
-        entry_identifier_data: The identifier data for this entry
+        entry: The bibtex entry to process; its current key is the original key
+        new_key: Label generated for this entry
         existing_keys: Set of existing keys to avoid duplicates
-        original_key: Original key of the entry
 
     Returns:
-        New generated key if successful, None otherwise
+        New key if accepted, None if it duplicates an existing key
     """
-    try:
-        # Write entry to temporary bib file
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".bib", delete=False, encoding="utf-8"
-        ) as temp_bib:
-            # Write the entry in proper BibTeX format
-            temp_bib.write(f"@{entry.entry_type}{{{original_key},\n")
-            for field_name, field_value in entry.fields_dict.items():
-                temp_bib.write(f"  {field_name} = {{{field_value.value}}},\n")
-            temp_bib.write("}\n")
-            temp_bib_path = Path(temp_bib.name)
-
-        # Write identifier to temporary JSON file
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False, encoding="utf-8"
-        ) as temp_json:
-            json.dump({original_key: entry_identifier_data}, temp_json, indent=2)
-            temp_json_path = Path(temp_json.name)
+    # Check for duplicates
+    if new_key in existing_keys:
+        logger.warning("Skipping duplicate key: %s", new_key)
+        return None
 
-        try:
-            generated_labels = generate_labels(temp_bib_path, temp_json_path)
-        finally:
-            # Clean up temporary files
-            temp_bib_path.unlink(missing_ok=True)
-            temp_json_path.unlink(missing_ok=True)
-
-        if original_key not in generated_labels:
-            logger.error(f"Failed to generate label for {original_key}")
-            return None
+    logger.info("Generated new key: %s -> %s", entry.key, new_key)
 
-        new_key = generated_labels[original_key]
+    # Update entry with new key
+    entry.key = new_key
 
-        # Check for duplicates
-        if new_key in existing_keys:
-            logger.warning(f"Skipping duplicate key: {new_key}")
-            return None
+    return new_key
 
-        logger.info(f"Generated new key: {original_key} -> {new_key}")
 
-        # Update entry with new key
-        entry.key = new_key
+def _splice_json_members(data: bytes, addition: bytes) -> bytes | None:
+    """Append the members of one indented JSON container to another, as bytes.
 
-        return new_key
+    Both documents must be non-empty objects (or arrays) formatted with
+    ``indent=2``. The members of ``addition`` are inserted before the closing
+    bracket of ``data``, so the existing members are copied verbatim instead of
+    being decoded and re-encoded, and any trailing newline in ``data`` is kept.
 
-    except Exception as e:
-        # Keep this as Exception since generate_labels can have various errors
-        logger.error(f"Error processing entry {original_key}: {e}")
+    Args:
+        data: Existing file contents
+        addition: Formatted container holding the members to add
+
+    Returns:
+        The combined document, or None if ``data`` is empty or its last member
+        is not indented by exactly two spaces
+    """
+    body = data.rstrip()
+    closing = b"\n" + addition[-1:]
+    if not body.endswith(closing) or body[: -len(closing)].rstrip()[-1:] in (b"{", b"[", b","):
         return None
+    cut = len(body) - len(closing)
+    # The appended members are indented by two spaces, so only splice into a
+    # file whose last top-level line uses the same indent
+    last_line = body[body.rfind(b"\n", 0, cut) + 1 : cut]
+    if not last_line.startswith(b"  ") or last_line[2:3].isspace():
+        return None
+    return data[:cut] + b",\n" + addition[2:-2] + data[cut:]
 
 
-def _load_existing_data(
-    bib_path: Path, identifier_path: Path, add_order_path: Path
-) -> tuple[bibtexparser.Library, IdentifierCollection, AddOrderList]:
-    """Load existing data from the three data files.
+def _merged_identifier_collection(path: Path, updates: IdentifierCollection) -> bytes:
+    """Return the contents of identifier_collection.json with ``updates`` added.
 
     Args:
-        bib_path: Path to library.bib
-        identifier_path: Path to identifier_collection.json
-        add_order_path: Path to add_order.json
+        path: Path to identifier_collection.json
+        updates: New identifier data keyed by citekey
 
     Returns:
-        Tuple of (library, identifier_collection, add_order)
+        Encoded JSON document to write back
     """
-    # Load library
-    if bib_path.exists():
-        library = bibtexparser.parse_file(str(bib_path))
-    else:
-        library = bibtexparser.Library()
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return _encode_json(updates)
 
-    # Load identifier collection
-    identifier_collection: IdentifierCollection = {}
-    if identifier_path.exists():
-        with open(identifier_path, encoding="utf-8") as f:
-            raw_data = json.load(f)
-            identifier_collection = msgspec.convert(raw_data, type=dict[str, IdentifierData])
+    # Only the keys are decoded to rule out overwrites; values stay as raw bytes
+    if _ID_KEYS_DECODER.decode(data).keys().isdisjoint(updates):
+        spliced = _splice_json_members(data, _encode_json(updates))
+        if spliced is not None:
+            return spliced
 
-    # Load add order
-    add_order: AddOrderList = []
-    if add_order_path.exists():
-        with open(add_order_path, encoding="utf-8") as f:
-            raw_data = json.load(f)
-            add_order = msgspec.convert(raw_data, type=list[str])
+    identifier_collection = _ID_COLL_DECODER.decode(data)
+    identifier_collection.update(updates)
+    return _encode_json(identifier_collection)
 
-    return library, identifier_collection, add_order
 
+def _unrecorded_keys(add_order: AddOrderList, new_keys: AddOrderList) -> AddOrderList:
+    """Return ``new_keys`` without keys already in ``add_order`` or repeated earlier.
 
-def _add_entries_to_data(
-    new_entries: list[tuple[str, dict[str, Entry], dict[str, IdentifierData]]],
-    library: bibtexparser.Library,
-    identifier_collection: IdentifierCollection,
-    add_order: AddOrderList,
-) -> None:
-    """Add new entries to the data structures.
+    Args:
+        add_order: Current add order
+        new_keys: Citekeys about to be appended
+
+    Returns:
+        Keys to append, in their original order
+    """
+    seen = set(add_order)
+    unrecorded: AddOrderList = []
+    for key in new_keys:
+        if key not in seen:
+            seen.add(key)
+            unrecorded.append(key)
+    return unrecorded
+
+
+def _extended_add_order(path: Path, new_keys: AddOrderList) -> bytes:
+    """Return the contents of add_order.json with ``new_keys`` appended.
+
+    Keys that are already recorded are not appended a second time.
 
     Args:
-        new_entries: List of (key, entry_data, identifier_data) tuples
-        library: Library to add entries to
-        identifier_collection: Identifier collection to update
-        add_order: Add order list to append to
+        path: Path to add_order.json
+        new_keys: Citekeys to append, in order
+
+    Returns:
+        Encoded JSON document to write back
     """
-    for new_key, entry_data, identifier_data in new_entries:
-        logger.debug(f"Processing entry: {new_key}")
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return _encode_json(_unrecorded_keys([], new_keys))
 
-        # Add to library
-        for entry_key, entry in entry_data.items():
-            logger.debug(f"Adding entry {entry_key} of type {type(entry)}")
-            library.add(entry)  # Use library.add() instead of library.entries.append()
+    add_order = _ADD_ORDER_DECODER.decode(data)
+    new_keys = _unrecorded_keys(add_order, new_keys)
+    if not new_keys:
+        return data
 
-        # Add to identifier collection
-        identifier_collection.update(identifier_data)
+    spliced = _splice_json_members(data, _encode_json(new_keys))
+    if spliced is not None:
+        return spliced
+    return _encode_json(add_order + new_keys)
 
-        # Add to add_order
-        add_order.append(new_key)
 
-        logger.debug(f"Added entry: {new_key}")
+@contextmanager
+def _append_writer(path: Path) -> Generator[BinaryIO]:
+    """Open ``path`` for appending and truncate it back to its old size on error.
 
+    The caller flushes and fsyncs before leaving the block, so that anything done
+    after the append inside the block (and failing) still rolls it back.
 
-def _write_data_files(
-    library: bibtexparser.Library,
-    identifier_collection: IdentifierCollection,
-    add_order: AddOrderList,
-    bib_path: Path,
-    identifier_path: Path,
-    add_order_path: Path,
-) -> None:
-    """Write data structures back to files.
+    Args:
+        path: File to append to; created if missing
+
+    Yields:
+        Binary file object positioned at the end of the file
+    """
+    with open(path, "ab", buffering=_WRITE_BUFFER) as f:
+        start = f.tell()
+        try:
+            yield f
+        except BaseException:
+            f.truncate(start)
+            raise
+
+
+def _bib_append_separator(bib_path: Path) -> bytes:
+    """Return the bytes that must precede entries appended to ``bib_path``.
+
+    The separator leaves a blank line before the new entries, as bibtexparser
+    does between blocks, whether or not the file ends with a newline.
 
     Args:
-        library: Library to write
-        identifier_collection: Identifier collection to write
-        add_order: Add order list to write
         bib_path: Path to library.bib
-        identifier_path: Path to identifier_collection.json
-        add_order_path: Path to add_order.json
+
+    Returns:
+        Empty bytes for a missing or empty file, otherwise the block separator
     """
-    # Write back to files with UTF-8 encoding
-    bib_string = bibtexparser.write_string(library)
-    with open(bib_path, "w", encoding="utf-8") as f:
-        f.write(bib_string)
+    try:
+        with open(bib_path, "rb") as f:
+            if f.seek(0, os.SEEK_END) == 0:
+                return b""
+            f.seek(-1, os.SEEK_END)
+            last_byte = f.read(1)
+    except FileNotFoundError:
+        return b""
+    return b"\n\n" if last_byte == b"\n" else b"\n\n\n"
 
-    with open(identifier_path, "w", encoding="utf-8") as f:
-        json.dump(identifier_collection, f, indent=2, ensure_ascii=False)
 
-    with open(add_order_path, "w", encoding="utf-8") as f:
-        json.dump(add_order, f, indent=2, ensure_ascii=False)
+def _verify_appended_entries(bib_path: Path, offset: int, expected_keys: list[str]) -> None:
+    """Re-parse the bytes appended to ``bib_path`` and check they hold exactly the new entries.
+
+    Args:
+        bib_path: Path to library.bib
+        offset: File size before the append
+        expected_keys: Citekeys of the appended entries, in order
+
+    Raises:
+        InvalidDataError: If the appended text does not parse back to the new entries
+    """
+    with open(bib_path, "rb") as f:
+        f.seek(offset)
+        appended = bibtexparser.parse_string(f.read().decode("utf-8"))
+
+    appended_keys = [entry.key for entry in appended.entries]
+    if appended.failed_blocks or appended_keys != expected_keys:
+        failed = len(appended.failed_blocks)
+        raise InvalidDataError(
+            f"Appended entries in {bib_path} parsed back as {appended_keys} ({failed} failed)"
+        )
+
+
+def _write_bib_streaming(blocks: Iterable[Block], f: BinaryIO) -> None:
+    """Write blocks one at a time instead of materializing one big string.
+
+    Each block is serialized with ``bibtexparser.write_string`` on a one-block
+    library, so the output is identical to writing the whole library at once,
+    but peak memory stays at one block rather than a second copy of the file.
+
+    Args:
+        blocks: Blocks to write
+        f: Binary file object to write to
+    """
+    for i, block in enumerate(blocks):
+        if i:
+            f.write(b"\n\n")  # bibtexparser's default block separator
+        f.write(bibtexparser.write_string(bibtexparser.Library([block])).encode("utf-8"))
+
+
+def _write_json_files(targets: list[tuple[Path, bytes, Path]]) -> None:
+    """Write the JSON data files so that either all or none of them are updated.
+
+    Every file is written and fsynced to a sibling temp file before any destination
+    is replaced. If a later replace fails, the files already replaced are restored
+    from their backup copies (or removed if they did not exist before).
+
+    Args:
+        targets: ``(path, encoded_json, backup_copy)`` for each file, in write order
+    """
+    tmp_paths = [path.with_name(path.name + ".tmp") for path, _, _ in targets]
+    try:
+        for (_, data, _), tmp_path in zip(targets, tmp_paths, strict=True):
+            with open(tmp_path, "wb", buffering=_WRITE_BUFFER) as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+
+        replaced: list[tuple[Path, Path]] = []
+        try:
+            for (path, _, backup_copy), tmp_path in zip(targets, tmp_paths, strict=True):
+                os.replace(tmp_path, path)
+                replaced.append((path, backup_copy))
+        except BaseException:
+            for path, backup_copy in replaced:
+                if backup_copy.exists():
+                    shutil.copyfile(backup_copy, path)
+                else:
+                    path.unlink(missing_ok=True)
+            raise
+    finally:
+        for tmp_path in tmp_paths:
+            tmp_path.unlink(missing_ok=True)
 
 
 def append_to_files(
@@ -411,52 +602,86 @@ def append_to_files(
     bib_path: Path,
     identifier_path: Path,
     add_order_path: Path,
+    config: WorkspaceConfig | None = None,
 ) -> bool:
     """Append new entries to the three data files.
 
+    New entries are appended to the end of library.bib, so the existing library
+    is never re-written: its citekeys are scanned to refuse duplicates, and only
+    the appended text is parsed back to verify it. If anything fails, library.bib
+    is truncated back to its previous size and the JSON files are left untouched.
+
     Args:
         new_entries: List of (key, entry_data, identifier_data) tuples
         bib_path: Path to library.bib
         identifier_path: Path to identifier_collection.json
         add_order_path: Path to add_order.json
+        config: Workspace configuration forwarded to the backup step
 
     Returns:
         True if successful, False otherwise
+
+    Raises:
+        InvalidDataError: If a new citekey is already in library.bib, or the appended
+            text does not parse back to the new entries
+        FileOperationError: If reading or writing the data files fails
     """
     if not new_entries:
         logger.info("No new entries to append")
         return True
 
-    logger.info(f"Appending {len(new_entries)} new entries to data files")
+    logger.info("Appending %d new entries to data files", len(new_entries))
 
     # MANDATORY: Create backup before any data file modification
     workspace = bib_path.parent.parent  # Go up from bib/ to workspace
     try:
-        backup_path = create_backup(workspace)
-        logger.info(f"✓ Backup created: {backup_path}")
+        backup_path = create_backup(workspace, config)
+        logger.info("✓ Backup created: %s", backup_path)
     except BackupError as e:
-        logger.error(f"✗ Backup failed: {e}")
+        logger.error("✗ Backup failed: %s", e)
         return False
 
     try:
-        # Load existing data
-        library, identifier_collection, add_order = _load_existing_data(
-            bib_path, identifier_path, add_order_path
-        )
-
-        # Add new entries to data structures
-        _add_entries_to_data(new_entries, library, identifier_collection, add_order)
-
-        # Write data back to files
-        _write_data_files(
-            library, identifier_collection, add_order, bib_path, identifier_path, add_order_path
+        new_keys = [new_key for new_key, _, _ in new_entries]
+        identifier_updates: IdentifierCollection = dict(
+            chain.from_iterable(identifier_data.items() for _, _, identifier_data in new_entries)
         )
+        entries = list(chain.from_iterable(entry_data.values() for _, entry_data, _ in new_entries))
+
+        identifier_json = _merged_identifier_collection(identifier_path, identifier_updates)
+        add_order_json = _extended_add_order(add_order_path, new_keys)
+
+        # Appending never re-parses the library, so check for clashing keys explicitly
+        entry_keys = [entry.key for entry in entries]
+        clashing = _scan_bib_keys(bib_path).intersection(entry_keys)
+        if clashing:
+            raise InvalidDataError(f"Citekeys already in {bib_path}: {sorted(clashing)}")
+
+        # The bib append is made durable and verified first; the JSON files are
+        # replaced last, inside the append, so any failure also truncates the bib
+        backup_dir = Path(backup_path)
+        separator = _bib_append_separator(bib_path)
+        with _append_writer(bib_path) as f:
+            offset = f.tell()
+            f.write(separator)
+            _write_bib_streaming(entries, f)
+            f.flush()
+            os.fsync(f.fileno())
+            _verify_appended_entries(bib_path, offset, entry_keys)
+            _write_json_files(
+                [
+                    (identifier_path, identifier_json, backup_dir / "identifier_collection.json"),
+                    (add_order_path, add_order_json, backup_dir / "add_order.json"),
+                ]
+            )
 
-        logger.info(f"Successfully appended {len(new_entries)} entries")
+        logger.info("Successfully appended %d entries", len(new_entries))
         return True
 
     except OSError as e:
         raise FileOperationError(f"Failed to write files: {e}") from e
+    except InvalidDataError:
+        raise
     except Exception as e:
         # Keep Exception for bibtexparser write errors
         raise FileOperationError(f"Failed to append entries: {e}") from e
@@ -469,17 +694,20 @@ def cleanup_processed_files(config: WorkspaceConfig, processed_slugs: list[str])
         config: Workspace configuration
         processed_slugs: List of slugs to clean up
     """
+    failed: list[str] = []
     for slug in processed_slugs:
-        bib_file = config.staging_dir / f"{slug}.bib"
-        json_file = config.staging_dir / f"{slug}.json"
-
         try:
-            bib_file.unlink()
-            json_file.unlink()
-            logger.info(f"Deleted processed staging files: {slug}")
+            (config.staging_dir / f"{slug}.bib").unlink(missing_ok=True)
+            (config.staging_dir / f"{slug}.json").unlink(missing_ok=True)
         except OSError as e:
-            logger.error(f"Failed to delete staging files for {slug}: {e}")
-            # Don't fail the whole operation for cleanup issues
+            logger.debug("Failed to delete staging files for %s: %s", slug, e)
+            failed.append(slug)
+        else:
+            logger.info("Deleted processed staging files: %s", slug)
+
+    # Don't fail the whole operation for cleanup issues
+    if failed:
+        logger.error("Failed to delete staging files for: %s", ", ".join(failed))
 
 
 def process_staging_pairs(
@@ -502,17 +730,17 @@ def process_staging_pairs(
         if result is not None:
             key_mapping, entry_data, identifier_data = result
 
-            # Convert to the format expected by append_to_files
-            for _original_key, new_key in key_mapping.items():
+            # Convert to the format expected by append_to_files; the new keys
+            # are already in existing_keys
+            for new_key in key_mapping.values():
                 new_entries.append(
                     (new_key, {new_key: entry_data[new_key]}, {new_key: identifier_data[new_key]})
                 )
-                existing_keys.add(new_key)  # Prevent duplicates within the batch
 
             processed_slugs.append(slug)
-            logger.info(f"Processed {len(key_mapping)} entries from {slug}")
+            logger.info("Processed %d entries from %s", len(key_mapping), slug)
         else:
-            logger.warning(f"Skipped staging pair: {slug}")
+            logger.warning("Skipped staging pair: %s", slug)
 
     return new_entries, processed_slugs
 
@@ -531,13 +759,14 @@ def add_entries_from_staging(workspace: Path) -> tuple[bool, list[str]]:
     # Create configuration
     config = WorkspaceConfig.from_workspace(workspace)
 
-    # Find staging pairs
+    # Find staging pairs first: with nothing staged, no data file is read at all
     pairs = find_staging_pairs(config.staging_dir)
     if not pairs:
         logger.info("No staging pairs found")
         return True, []
 
-    # Load existing keys and process staging pairs
+    # Only the keys are needed up front; new entries are appended without
+    # parsing the existing library
     existing_keys = load_existing_keys(config)
     new_entries, processed_slugs = process_staging_pairs(pairs, existing_keys)
 
@@ -547,12 +776,14 @@ def add_entries_from_staging(workspace: Path) -> tuple[bool, list[str]]:
 
     # Append to data files
     success = append_to_files(
-        new_entries, config.bib_path, config.identifier_path, config.add_order_path
+        new_entries, config.bib_path, config.identifier_path, config.add_order_path, config
     )
 
     if success:
+        # existing_keys now also holds the new keys, matching the files just written
+        _store_keys_cache(config, _data_file_stats(config), existing_keys)
         cleanup_processed_files(config, processed_slugs)
-        logger.info(f"Successfully added {len(new_entries)} new entries")
+        logger.info("Successfully added %d new entries", len(new_entries))
     else:
         logger.error("Failed to append entries, staging files preserved")
 
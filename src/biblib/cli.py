@@ -1,21 +1,24 @@
 """Command-line interface for biblatex library tools."""
 
 import argparse
-import json
 import logging
 import sys
+from collections.abc import Callable
+from functools import cache
+from itertools import islice
 from pathlib import Path
 
-from .add_entries import add_entries_from_staging
-from .generate import generate_labels
-from .normalize.accents import normalize_latex_accents
-from .normalize.dates import rename_year_to_date_fields
-from .normalize.eprint import normalize_eprint_fields
-from .normalize.publisher import normalize_publisher_location
-from .sort import sort_alphabetically, sort_by_add_order
-from .sync import sync_identifiers_to_library
-from .template import generate_staging_templates
-from .validate import fix_citekey_labels, validate_citekey_consistency, validate_citekey_labels
+from .config import WorkspaceConfig
+from .exceptions import BiblibError
+
+logger = logging.getLogger(__name__)
+
+# Choices are ordered tuples rather than sets: argparse renders them in iteration order
+# in usage and error messages, which must stay stable between runs.
+_SORT_MODES = ("alphabetical", "add-order")
+
+# Indexed by the clamped -v count
+_LOG_LEVELS = (logging.WARNING, logging.INFO, logging.DEBUG)
 
 
 def setup_logging(verbosity: int = 0) -> None:
@@ -24,25 +27,28 @@ def setup_logging(verbosity: int = 0) -> None:
     Args:
         verbosity: Logging verbosity level (0=WARNING, 1=INFO, 2+=DEBUG)
     """
-    level = {0: logging.WARNING, 1: logging.INFO}.get(min(verbosity, 1), logging.DEBUG)
+    level = _LOG_LEVELS[min(verbosity, 2)]
     logging.basicConfig(
         level=level,
         format="%(levelname)s %(name)s:%(lineno)d – %(message)s",
     )
 
 
-def cmd_generate_labels(args: argparse.Namespace) -> None:
+def cmd_generate_labels(args: argparse.Namespace) -> int:
     """Generate labels for biblatex entries."""
-    workspace = Path(args.workspace)
+    import msgspec
 
-    # Default paths based on standard repository layout
-    bib_path = workspace / "bib" / "library.bib"
-    identifier_path = workspace / "data" / "identifier_collection.json"
-    default_output = workspace / "bib" / "generated" / "labels.json"
+    from .generate import generate_labels
+
+    config = WorkspaceConfig.from_workspace(Path(args.workspace))
+    bib_path = config.bib_path
+    identifier_path = config.identifier_path
+    # Labels go next to the library unless --output is given
+    default_output = bib_path.parent / "generated" / "labels.json"
     output_path = Path(args.output) if args.output else default_output
 
-    logger = logging.getLogger(__name__)
     logger.info("Generating labels for biblatex entries")
+    show_preview = args.verbose and logger.isEnabledFor(logging.INFO)
 
     try:
         # Generate labels
@@ -51,38 +57,40 @@ def cmd_generate_labels(args: argparse.Namespace) -> None:
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Save labels to JSON file
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(labels, f, indent=2, ensure_ascii=False)
+        # Save labels to JSON file (same bytes as json.dump(indent=2, ensure_ascii=False))
+        output_path.write_bytes(msgspec.json.format(msgspec.json.encode(labels), indent=2))
 
-        logger.info(f"✓ Generated {len(labels)} labels")
-        logger.info(f"✓ Saved to: {output_path}")
+        logger.info("✓ Generated %d labels", len(labels))
+        logger.info("✓ Saved to: %s", output_path)
 
         # Optionally show first few labels for verification
-        if args.verbose and labels:
-            logger.info("Sample labels:")
-            for i, (old_key, new_label) in enumerate(labels.items()):
-                if i >= 5:  # Show first 5 as examples
-                    break
-                logger.info(f"  {old_key} -> {new_label}")
+        if show_preview and labels:
+            # Show first 5 as examples, in a single log record
+            sample = islice(labels.items(), 5)
+            logger.info(
+                "Sample labels:\n%s",
+                "\n".join(f"  {old_key} -> {new_label}" for old_key, new_label in sample),
+            )
 
-        sys.exit(0)
+        return 0
 
     except (FileNotFoundError, ValueError) as e:
-        logger.error(f"Label generation error: {e}")
-        sys.exit(1)
+        logger.error("Label generation error: %s", e)
+        return 1
 
 
-def cmd_validate(args: argparse.Namespace) -> None:
+def cmd_validate(args: argparse.Namespace) -> int:
     """Run validation checks on the biblatex library."""
-    workspace = Path(args.workspace)
-
-    # Default paths based on standard repository layout
-    bib_path = workspace / "bib" / "library.bib"
-    add_order_path = workspace / "data" / "add_order.json"
-    identifier_path = workspace / "data" / "identifier_collection.json"
+    from .validate import (
+        fix_citekey_labels,
+        validate_citekey_consistency,
+        validate_citekey_labels,
+    )
 
-    logger = logging.getLogger(__name__)
+    config = WorkspaceConfig.from_workspace(Path(args.workspace))
+    bib_path = config.bib_path
+    add_order_path = config.add_order_path
+    identifier_path = config.identifier_path
 
     if args.fix:
         logger.info("Starting validation and fixing citekeys")
@@ -95,7 +103,7 @@ def cmd_validate(args: argparse.Namespace) -> None:
 
             if not is_consistent:
                 logger.error("✗ Cannot fix citekeys: consistency issues must be resolved first")
-                sys.exit(1)
+                return 1
 
             # Fix citekey labels
             fix_successful = fix_citekey_labels(
@@ -104,14 +112,14 @@ def cmd_validate(args: argparse.Namespace) -> None:
 
             if fix_successful:
                 logger.info("✓ All citekey fixes applied successfully")
-                sys.exit(0)
+                return 0
             else:
                 logger.error("✗ Failed to fix some citekeys")
-                sys.exit(1)
+                return 1
 
         except (FileNotFoundError, ValueError) as e:
-            logger.error(f"Fix error: {e}")
-            sys.exit(1)
+            logger.error("Fix error: %s", e)
+            return 1
     else:
         logger.info("Starting validation checks")
 
@@ -131,26 +139,24 @@ def cmd_validate(args: argparse.Namespace) -> None:
 
             if all_valid:
                 logger.info("✓ All validation checks passed")
-                sys.exit(0)
+                return 0
             else:
                 logger.error("✗ Validation checks failed")
-                sys.exit(1)
+                return 1
 
         except (FileNotFoundError, ValueError) as e:
-            logger.error(f"Validation error: {e}")
-            sys.exit(1)
+            logger.error("Validation error: %s", e)
+            return 1
 
 
-def cmd_sort(args: argparse.Namespace) -> None:
+def cmd_sort(args: argparse.Namespace) -> int:
     """Sort library files."""
-    workspace = Path(args.workspace)
+    from .sort import sort_alphabetically, sort_by_add_order
 
-    # Default paths based on standard repository layout
-    bib_path = workspace / "bib" / "library.bib"
-    add_order_path = workspace / "data" / "add_order.json"
-    identifier_path = workspace / "data" / "identifier_collection.json"
-
-    logger = logging.getLogger(__name__)
+    config = WorkspaceConfig.from_workspace(Path(args.workspace))
+    bib_path = config.bib_path
+    add_order_path = config.add_order_path
+    identifier_path = config.identifier_path
 
     try:
         if args.mode == "alphabetical":
@@ -168,31 +174,31 @@ def cmd_sort(args: argparse.Namespace) -> None:
                 add_order_path=add_order_path,
             )
         else:
-            logger.error(f"Invalid sort mode: {args.mode}")
-            sys.exit(1)
+            logger.error("Invalid sort mode: %s", args.mode)
+            return 1
 
         logger.info("✓ Sort operation completed successfully")
+        return 0
 
     except (FileNotFoundError, ValueError) as e:
-        logger.error(f"Sort error: {e}")
-        sys.exit(1)
+        logger.error("Sort error: %s", e)
+        return 1
 
 
-def cmd_sync(args: argparse.Namespace) -> None:
+def cmd_sync(args: argparse.Namespace) -> int:
     """Sync identifier fields from identifier collection to library.bib."""
-    workspace = Path(args.workspace)
+    from .sync import sync_identifiers_to_library
 
-    # Default paths based on standard repository layout
-    bib_path = workspace / "bib" / "library.bib"
-    identifier_path = workspace / "data" / "identifier_collection.json"
-
-    logger = logging.getLogger(__name__)
+    config = WorkspaceConfig.from_workspace(Path(args.workspace))
+    bib_path = config.bib_path
+    identifier_path = config.identifier_path
 
     # Parse fields to sync if provided
     fields_to_sync = None
     if args.fields:
-        fields_to_sync = set(field.strip() for field in args.fields.split(","))
-        logger.info(f"Syncing specific fields: {', '.join(sorted(fields_to_sync))}")
+        fields_to_sync = set(map(str.strip, args.fields.split(",")))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Syncing specific fields: %s", ", ".join(sorted(fields_to_sync)))
 
     try:
         success, changes = sync_identifiers_to_library(
@@ -204,198 +210,225 @@ def cmd_sync(args: argparse.Namespace) -> None:
 
         if success:
             if args.dry_run:
-                logger.info(f"✓ Dry run completed: {len(changes)} potential changes")
+                logger.info("✓ Dry run completed: %d potential changes", len(changes))
                 if changes:
-                    logger.info("Changes that would be made:")
-                    for change in changes[:10]:  # Show first 10 changes
-                        logger.info(f"  {change}")
+                    # Show first 10 changes, in a single log record
+                    lines = [f"  {change}" for change in changes[:10]]
                     if len(changes) > 10:
-                        logger.info(f"  ... and {len(changes) - 10} more changes")
+                        lines.append(f"  ... and {len(changes) - 10} more changes")
+                    logger.info("Changes that would be made:\n%s", "\n".join(lines))
             else:
-                logger.info(f"✓ Sync completed: {len(changes)} changes applied")
-            sys.exit(0)
+                logger.info("✓ Sync completed: %d changes applied", len(changes))
+            return 0
         else:
             logger.error("✗ Sync failed")
-            sys.exit(1)
+            return 1
 
     except (FileNotFoundError, ValueError) as e:
-        logger.error(f"Sync error: {e}")
-        sys.exit(1)
+        logger.error("Sync error: %s", e)
+        return 1
 
 
-def cmd_normalize(args: argparse.Namespace) -> None:
-    """Apply normalization routines to the library."""
-    workspace = Path(args.workspace)
+def _normalize_year_to_date(bib_path: Path, dry_run: bool, show_preview: bool) -> None:
+    """Rename year fields to date fields."""
+    from .normalize.dates import rename_year_to_date_fields
 
-    bib_path = workspace / "bib" / "library.bib"
+    updated_count, updated_keys = rename_year_to_date_fields(bib_path, dry_run=dry_run)
 
-    logger = logging.getLogger(__name__)
+    if dry_run:
+        logger.info(
+            "Dry run complete: %d entries would be converted from year to date",
+            updated_count,
+        )
+    else:
+        logger.info(
+            "✓ Converted %d entries from year to date fields",
+            updated_count,
+        )
 
-    try:
-        if args.action == "year-to-date":
-            updated_count, updated_keys = rename_year_to_date_fields(bib_path, dry_run=args.dry_run)
+    if show_preview and updated_keys:
+        preview = ", ".join(updated_keys[:10])
+        suffix = "..." if len(updated_keys) > 10 else ""
+        logger.info("Affected entries: %s%s", preview, suffix)
 
-            if args.dry_run:
-                logger.info(
-                    "Dry run complete: %d entries would be converted from year to date",
-                    updated_count,
-                )
-            else:
-                logger.info(
-                    "✓ Converted %d entries from year to date fields",
-                    updated_count,
-                )
-
-            if args.verbose and updated_keys:
-                preview = ", ".join(updated_keys[:10])
-                suffix = "..." if len(updated_keys) > 10 else ""
-                logger.info("Affected entries: %s%s", preview, suffix)
-
-            sys.exit(0)
-
-        if args.action == "publisher-location":
-            report = normalize_publisher_location(bib_path, dry_run=args.dry_run)
-
-            if report.fixed:
-                message = (
-                    "Dry run complete: %d entries would have publisher/location split"
-                    if args.dry_run
-                    else "✓ Split publisher/location for %d entries"
-                )
-                logger.info(message, len(report.fixed))
-                if args.verbose:
-                    preview = ", ".join(report.fixed[:10])
-                    suffix = "..." if len(report.fixed) > 10 else ""
-                    logger.info("Split entries: %s%s", preview, suffix)
-
-            fixed_set = set(report.fixed)
-            remaining = [key for key in report.flagged if key not in fixed_set]
-            if remaining:
-                preview = ", ".join(remaining[:10])
-                suffix = "..." if len(remaining) > 10 else ""
-                logger.warning(
-                    "Entries with publisher but unresolved location: %s%s", preview, suffix
-                )
-            elif not report.fixed:
-                logger.info("No publisher/location issues found")
-
-            sys.exit(0)
-
-        if args.action == "eprint-fields":
-            report = normalize_eprint_fields(bib_path, dry_run=args.dry_run)
-
-            action_prefix = "Dry run complete" if args.dry_run else "✓ Applied"
-            total_entries = len(
-                set(report.renamed_type) | set(report.renamed_class) | set(report.normalized_type)
-            )
 
-            if total_entries:
-                logger.info(
-                    "%s: eprint field normalization touched %d entries",
-                    action_prefix,
-                    total_entries,
-                )
-            else:
-                logger.info("%s: no eprint field changes required", action_prefix)
-
-            details = [
-                ("Renamed archiveprefix→eprinttype", report.renamed_type),
-                ("Renamed primaryclass→eprintclass", report.renamed_class),
-                ("Lowercased eprinttype", report.normalized_type),
-            ]
-
-            for label, keys in details:
-                if not keys:
-                    continue
-                logger.info("%s for %d entries", label, len(keys))
-                if args.verbose:
-                    preview = ", ".join(keys[:10])
-                    suffix = "..." if len(keys) > 10 else ""
-                    logger.info("  %s%s", preview, suffix)
-
-            sys.exit(0)
-
-        if args.action == "latex-accents":
-            report = normalize_latex_accents(bib_path, dry_run=args.dry_run)
-
-            action_prefix = "Dry run complete" if args.dry_run else "✓ Applied"
-            if report.total_fields:
-                logger.info(
-                    "%s: converted LaTeX accents in %d fields across %d entries",
-                    action_prefix,
-                    report.total_fields,
-                    len(report.converted),
-                )
-            else:
-                logger.info("%s: no LaTeX accent changes required", action_prefix)
+def _normalize_publisher_location(bib_path: Path, dry_run: bool, show_preview: bool) -> None:
+    """Split combined publisher/location values and flag missing locations."""
+    from .normalize.publisher import normalize_publisher_location
 
-            if args.verbose and report.total_fields:
-                preview_items = list(report.converted.items())[:5]
-                for key, fields in preview_items:
-                    logger.info("%s: %s", key, ", ".join(fields))
-                remaining = len(report.converted) - len(preview_items)
-                if remaining > 0:
-                    logger.info("... and %d more entries", remaining)
+    report = normalize_publisher_location(bib_path, dry_run=dry_run)
 
-            sys.exit(0)
+    if report.fixed:
+        message = (
+            "Dry run complete: %d entries would have publisher/location split"
+            if dry_run
+            else "✓ Split publisher/location for %d entries"
+        )
+        logger.info(message, len(report.fixed))
+        if show_preview:
+            preview = ", ".join(report.fixed[:10])
+            suffix = "..." if len(report.fixed) > 10 else ""
+            logger.info("Split entries: %s%s", preview, suffix)
+
+    fixed_set = set(report.fixed)
+    remaining = [key for key in report.flagged if key not in fixed_set]
+    if remaining:
+        preview = ", ".join(remaining[:10])
+        suffix = "..." if len(remaining) > 10 else ""
+        logger.warning("Entries with publisher but unresolved location: %s%s", preview, suffix)
+    elif not report.fixed:
+        logger.info("No publisher/location issues found")
+
+
+def _normalize_eprint_fields(bib_path: Path, dry_run: bool, show_preview: bool) -> None:
+    """Migrate legacy arXiv fields and normalize eprinttype."""
+    from .normalize.eprint import normalize_eprint_fields
+
+    report = normalize_eprint_fields(bib_path, dry_run=dry_run)
+
+    action_prefix = "Dry run complete" if dry_run else "✓ Applied"
+    total_entries = len(
+        set(report.renamed_type) | set(report.renamed_class) | set(report.normalized_type)
+    )
 
-        logger.error(f"Unknown normalization action: {args.action}")
-        sys.exit(1)
+    if total_entries:
+        logger.info(
+            "%s: eprint field normalization touched %d entries",
+            action_prefix,
+            total_entries,
+        )
+    else:
+        logger.info("%s: no eprint field changes required", action_prefix)
+
+    details = [
+        ("Renamed archiveprefix→eprinttype", report.renamed_type),
+        ("Renamed primaryclass→eprintclass", report.renamed_class),
+        ("Lowercased eprinttype", report.normalized_type),
+    ]
+
+    # All categories (and their previews) go out as a single log record
+    lines: list[str] = []
+    for label, keys in details:
+        if not keys:
+            continue
+        lines.append(f"{label} for {len(keys)} entries")
+        if show_preview:
+            suffix = "..." if len(keys) > 10 else ""
+            lines.append(f"  {', '.join(keys[:10])}{suffix}")
+    if lines:
+        logger.info("%s", "\n".join(lines))
+
+
+def _normalize_latex_accents(bib_path: Path, dry_run: bool, show_preview: bool) -> None:
+    """Convert LaTeX accent commands into Unicode."""
+    from .normalize.accents import normalize_latex_accents
+
+    report = normalize_latex_accents(bib_path, dry_run=dry_run)
+
+    action_prefix = "Dry run complete" if dry_run else "✓ Applied"
+    if report.total_fields:
+        logger.info(
+            "%s: converted LaTeX accents in %d fields across %d entries",
+            action_prefix,
+            report.total_fields,
+            len(report.converted),
+        )
+    else:
+        logger.info("%s: no LaTeX accent changes required", action_prefix)
+
+    if show_preview and report.total_fields:
+        lines = [
+            f"{key}: {', '.join(fields)}" for key, fields in islice(report.converted.items(), 5)
+        ]
+        remaining = len(report.converted) - len(lines)
+        if remaining > 0:
+            lines.append(f"... and {remaining} more entries")
+        logger.info("%s", "\n".join(lines))
+
+
+_NORMALIZE_HANDLERS: dict[str, Callable[[Path, bool, bool], None]] = {
+    "year-to-date": _normalize_year_to_date,
+    "publisher-location": _normalize_publisher_location,
+    "eprint-fields": _normalize_eprint_fields,
+    "latex-accents": _normalize_latex_accents,
+}
+_NORMALIZE_ACTIONS = tuple(_NORMALIZE_HANDLERS)
+
+
+def cmd_normalize(args: argparse.Namespace) -> int:
+    """Apply normalization routines to the library."""
+    handler = _NORMALIZE_HANDLERS.get(args.action)
+    if handler is None:
+        logger.error("Unknown normalization action: %s", args.action)
+        return 1
 
+    bib_path = WorkspaceConfig.from_workspace(Path(args.workspace)).bib_path
+    # Preview strings are only built when they will actually be emitted
+    show_preview = args.verbose and logger.isEnabledFor(logging.INFO)
+
+    try:
+        handler(bib_path, args.dry_run, show_preview)
     except (FileNotFoundError, ValueError) as exc:
-        logger.error(f"Normalize error: {exc}")
-        sys.exit(1)
+        logger.error("Normalize error: %s", exc)
+        return 1
+
+    return 0
 
 
-def cmd_add(args: argparse.Namespace) -> None:
+def cmd_add(args: argparse.Namespace) -> int:
     """Add new entries from staging files to the main library."""
-    workspace = Path(args.workspace)
-    logger = logging.getLogger(__name__)
+    from .add_entries import add_entries_from_staging
 
+    workspace = Path(args.workspace)
     try:
         success, processed_slugs = add_entries_from_staging(workspace=workspace)
 
         if success:
             if processed_slugs:
-                logger.info(f"✓ Successfully added {len(processed_slugs)} new entries")
-                logger.info(f"Processed files: {', '.join(processed_slugs)}")
+                logger.info("✓ Successfully added %d new entries", len(processed_slugs))
+                logger.info("Processed files: %s", ", ".join(processed_slugs))
             else:
                 logger.info("✓ No new entries to add")
-            sys.exit(0)
+            return 0
         else:
             logger.error("✗ Failed to add entries")
-            sys.exit(1)
+            return 1
 
-    except (FileNotFoundError, ValueError) as e:
-        logger.error(f"Add entries error: {e}")
-        sys.exit(1)
+    except (BiblibError, FileNotFoundError, ValueError) as e:
+        logger.error("Add entries error: %s", e)
+        return 1
 
 
-def cmd_template(args: argparse.Namespace) -> None:
+def cmd_template(args: argparse.Namespace) -> int:
     """Generate identifier collection templates for staging .bib files."""
-    workspace = Path(args.workspace)
-    logger = logging.getLogger(__name__)
+    from .template import generate_staging_templates
 
+    workspace = Path(args.workspace)
     try:
         files_processed, generated_files = generate_staging_templates(
             workspace=workspace, overwrite=args.overwrite
         )
 
         if files_processed > 0:
-            logger.info(f"✓ Generated {files_processed} identifier templates")
-            logger.info(f"Created files: {', '.join(generated_files)}")
+            logger.info("✓ Generated %d identifier templates", files_processed)
+            logger.info("Created files: %s", ", ".join(generated_files))
         else:
             logger.info("✓ No templates to generate (all .bib files already have .json companions)")
 
-        sys.exit(0)
+        return 0
 
     except (FileNotFoundError, ValueError) as e:
-        logger.error(f"Template generation error: {e}")
-        sys.exit(1)
+        logger.error("Template generation error: %s", e)
+        return 1
 
 
+@cache
 def create_parser() -> argparse.ArgumentParser:
-    """Create the argument parser for the CLI."""
+    """Create the argument parser for the CLI.
+
+    The parser is built once per process and shared by later calls, so callers
+    must not add arguments to the returned instance.
+    """
     parser = argparse.ArgumentParser(
         prog="blx",
         description="Tools for a curated biblatex library: validate, sort, sync, normalize.",
@@ -444,7 +477,7 @@ def create_parser() -> argparse.ArgumentParser:
         "mode",
         nargs="?",
         default="alphabetical",
-        choices=["alphabetical", "add-order"],
+        choices=_SORT_MODES,
         help="Sort mode: 'alphabetical' sorts by citekey alphabetically (default), "
         + "'add-order' sorts to match add_order.json sequence",
     )
@@ -472,7 +505,7 @@ def create_parser() -> argparse.ArgumentParser:
     )
     normalize_parser.add_argument(
         "action",
-        choices=["year-to-date", "publisher-location", "eprint-fields", "latex-accents"],
+        choices=_NORMALIZE_ACTIONS,
         help=(
             "Choose normalization action. 'year-to-date' renames entries with year but no date "
             "to use the date field. 'publisher-location' splits combined publisher/location "
@@ -524,8 +557,8 @@ def main() -> None:
         parser.print_help()
         sys.exit(1)
 
-    # Execute the subcommand
-    args.func(args)
+    # Execute the subcommand; handlers return the exit code instead of exiting
+    raise SystemExit(args.func(args))
 
 
 if __name__ == "__main__":
@@ -12,6 +12,7 @@ class WorkspaceConfig:
     identifier_path: Path
     add_order_path: Path
     staging_dir: Path
+    cache_dir: Path
 
     @classmethod
     def from_workspace(cls, workspace: Path) -> "WorkspaceConfig":
@@ -28,4 +29,5 @@ class WorkspaceConfig:
             identifier_path=workspace / "data" / "identifier_collection.json",
             add_order_path=workspace / "data" / "add_order.json",
             staging_dir=workspace / "staging",
+            cache_dir=workspace / ".cache",
         )
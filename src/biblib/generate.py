@@ -4,15 +4,41 @@ import hashlib
 import logging
 import re
 import unicodedata
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
 
 import bibtexparser
 import msgspec
+from bibtexparser.model import Entry
 
 from .types import IdentifierCollection, IdentifierData
 
 logger = logging.getLogger(__name__)
 
+_NON_LETTER_PATTERN = re.compile(r"[^a-zA-Z]")
+_YEAR_PATTERN = re.compile(r"\b(19|20)\d{2}\b")
+
+
+@lru_cache(maxsize=4096)
+def _fold_name(name: str) -> str:
+    """Strip accents and non-letters from a name and lowercase it.
+
+    Cached because last names repeat across a bibliography.
+
+    Args:
+        name: Raw last name
+
+    Returns:
+        ASCII-letter-only lowercase name, possibly empty
+    """
+    # Convert to NFD (decomposed form) and remove combining characters
+    decomposed = unicodedata.normalize("NFD", name)
+    stripped = "".join(c for c in decomposed if unicodedata.category(c) != "Mn")
+
+    # Clean up any remaining special characters and make lowercase
+    return _NON_LETTER_PATTERN.sub("", stripped).lower()
+
 
 def extract_lastname(author_str: str, sortname_str: str = "") -> str:
     """Extract the first author's last name from author field.
@@ -54,13 +80,7 @@ def extract_lastname(author_str: str, sortname_str: str = "") -> str:
             lastname = parts[-1] if parts else "unknown"
 
     # Normalize Unicode characters (remove accents) and keep only letters
-    # Convert to NFD (decomposed form) and remove combining characters
-    lastname = unicodedata.normalize("NFD", lastname)
-    lastname = "".join(c for c in lastname if unicodedata.category(c) != "Mn")
-
-    # Clean up any remaining special characters and make lowercase
-    lastname = re.sub(r"[^a-zA-Z]", "", lastname).lower()
-    return lastname or "unknown"
+    return _fold_name(lastname) or "unknown"
 
 
 def extract_year(year_str: str) -> str:
@@ -76,7 +96,7 @@ def extract_year(year_str: str) -> str:
         return "unknown"
 
     # Extract 4-digit year (19xx or 20xx)
-    year_match = re.search(r"\b(19|20)\d{2}\b", year_str)
+    year_match = _YEAR_PATTERN.search(year_str)
     if year_match:
         return year_match.group(0)
 
@@ -92,8 +112,56 @@ def create_hash(identifier: str) -> str:
     Returns:
         First 8 characters of SHA-256 hash as lowercase hex
     """
-    hash_obj = hashlib.sha256(identifier.encode("utf-8"))
-    return hash_obj.hexdigest()[:8]
+    # Non-cryptographic label suffix; SHA-256 is kept so existing citekeys stay
+    # stable, but only the 4 bytes that are used get hex-encoded.
+    return hashlib.sha256(identifier.encode("utf-8")).digest()[:4].hex()
+
+
+def _extract_entry_data(entry: Entry) -> dict[str, str]:
+    """Extract the fields used for label generation from a parsed entry.
+
+    Args:
+        entry: Parsed bibtexparser v2 entry
+
+    Returns:
+        Dictionary of the label-relevant fields (missing fields are empty strings)
+    """
+    entry_data: dict[str, str] = {
+        "type": entry.entry_type,
+        "key": entry.key,
+        "author": "",
+        "year": "",
+        "sortname": "",
+        "editor": "",
+        "shorthand": "",
+    }
+
+    # Extract fields using bibtexparser v2 API
+    fields_dict = entry.fields_dict
+
+    # Extract author field
+    if "author" in fields_dict:
+        entry_data["author"] = fields_dict["author"].value
+
+    # Extract editor field (fallback when no author)
+    if "editor" in fields_dict:
+        entry_data["editor"] = fields_dict["editor"].value
+
+    # Extract sortname field
+    if "sortname" in fields_dict:
+        entry_data["sortname"] = fields_dict["sortname"].value
+
+    # Extract shorthand field
+    if "shorthand" in fields_dict:
+        entry_data["shorthand"] = fields_dict["shorthand"].value
+
+    # Extract year field (check date first, then year)
+    if "date" in fields_dict:
+        entry_data["year"] = fields_dict["date"].value
+    elif "year" in fields_dict:
+        entry_data["year"] = fields_dict["year"].value
+
+    return entry_data
 
 
 def parse_bib_entries(bib_path: Path) -> dict[str, dict[str, str]]:
@@ -109,61 +177,25 @@ def parse_bib_entries(bib_path: Path) -> dict[str, dict[str, str]]:
         FileNotFoundError: If bib file doesn't exist
         ValueError: If parsing fails
     """
-    if not bib_path.exists():
-        raise FileNotFoundError(f"Bibliography file not found: {bib_path}")
-
     logger.debug(f"Parsing .bib file for label generation: {bib_path}")
 
     try:
-        lib = bibtexparser.parse_file(str(bib_path))
+        lib = bibtexparser.parse_file(bib_path)
 
         if lib.failed_blocks:
             failed_keys = [str(block) for block in lib.failed_blocks]
             raise ValueError(f"Failed to parse {len(lib.failed_blocks)} blocks: {failed_keys}")
 
-        entries: dict[str, dict[str, str]] = {}
-        for entry in lib.entries:
-            entry_key = entry.key
-            entry_data: dict[str, str] = {
-                "type": entry.entry_type,
-                "key": entry_key,
-                "author": "",
-                "year": "",
-                "sortname": "",
-                "editor": "",
-                "shorthand": "",
-            }
-
-            # Extract fields using bibtexparser v2 API
-            fields_dict = entry.fields_dict
-
-            # Extract author field
-            if "author" in fields_dict:
-                entry_data["author"] = fields_dict["author"].value
-
-            # Extract editor field (fallback when no author)
-            if "editor" in fields_dict:
-                entry_data["editor"] = fields_dict["editor"].value
-
-            # Extract sortname field
-            if "sortname" in fields_dict:
-                entry_data["sortname"] = fields_dict["sortname"].value
-
-            # Extract shorthand field
-            if "shorthand" in fields_dict:
-                entry_data["shorthand"] = fields_dict["shorthand"].value
-
-            # Extract year field (check date first, then year)
-            if "date" in fields_dict:
-                entry_data["year"] = fields_dict["date"].value
-            elif "year" in fields_dict:
-                entry_data["year"] = fields_dict["year"].value
-
-            entries[entry_key] = entry_data
+        entries: dict[str, dict[str, str]] = {
+            entry.key: _extract_entry_data(entry) for entry in lib.entries
+        }
 
         logger.debug(f"Extracted {len(entries)} entries for label generation")
         return entries
 
+    except FileNotFoundError as e:
+        # Let the open inside parse_file report a missing file instead of a separate stat
+        raise FileNotFoundError(f"Bibliography file not found: {bib_path}") from e
     except Exception as e:
         raise ValueError(f"Failed to parse {bib_path}: {e}") from e
 
@@ -181,22 +213,94 @@ def load_identifier_collection(identifier_path: Path) -> IdentifierCollection:
         FileNotFoundError: If file doesn't exist
         ValueError: If JSON is invalid
     """
-    if not identifier_path.exists():
-        raise FileNotFoundError(f"Identifier collection file not found: {identifier_path}")
-
     logger.debug(f"Loading identifier collection: {identifier_path}")
 
     try:
-        with open(identifier_path, "rb") as f:
-            data_dict = msgspec.json.decode(f.read(), type=dict[str, IdentifierData])
+        data_dict = msgspec.json.decode(
+            identifier_path.read_bytes(), type=dict[str, IdentifierData]
+        )
 
         logger.debug(f"Loaded {len(data_dict)} identifiers")
         return data_dict
 
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Identifier collection file not found: {identifier_path}") from e
     except msgspec.DecodeError as e:
         raise ValueError(f"Invalid JSON in {identifier_path}: {e}") from e
 
 
+def _build_label(
+    entry_key: str, entry_data: dict[str, str], identifier_data: IdentifierData | None
+) -> str:
+    """Build the ``lastname-year-hash`` label for a single entry.
+
+    Args:
+        entry_key: Current citekey of the entry
+        entry_data: Label-relevant fields as returned by ``_extract_entry_data``
+        identifier_data: Identifier data for the entry, if any
+
+    Returns:
+        Generated label
+    """
+    # Check if shorthand field exists and use it instead of author/editor lastname
+    shorthand = entry_data.get("shorthand", "").strip()
+    if shorthand:
+        # Use shorthand directly, normalize and clean it
+        lastname = _fold_name(shorthand) or "unknown"
+    else:
+        # Extract lastname and year - use author if available, otherwise editor
+        author_field = entry_data.get("author", "") or entry_data.get("editor", "")
+        lastname = extract_lastname(author_field, entry_data.get("sortname", ""))
+
+    year = extract_year(entry_data.get("year", ""))
+
+    # Get identifier for hashing
+    if identifier_data is not None:
+        main_identifier = identifier_data.main_identifier
+        if main_identifier and main_identifier in identifier_data.identifiers:
+            identifier_value = identifier_data.identifiers[main_identifier]
+            hash_part = create_hash(identifier_value)
+        else:
+            # Fallback: use the entry key itself
+            hash_part = create_hash(entry_key)
+    else:
+        # Entry not found in identifier collection, use entry key
+        hash_part = create_hash(entry_key)
+
+    return f"{lastname}-{year}-{hash_part}"
+
+
+def generate_labels_for_entry(entry: Entry, identifier_data: IdentifierData | None) -> str:
+    """Generate the label for an already-parsed entry without any file I/O.
+
+    Args:
+        entry: Parsed bibtexparser v2 entry
+        identifier_data: Identifier data for the entry, if any
+
+    Returns:
+        Generated label
+    """
+    return _build_label(entry.key, _extract_entry_data(entry), identifier_data)
+
+
+def generate_labels_for_entries(
+    entries: Iterable[Entry], identifier_collection: IdentifierCollection
+) -> dict[str, str]:
+    """Generate labels for a batch of already-parsed entries without any file I/O.
+
+    Args:
+        entries: Parsed bibtexparser v2 entries
+        identifier_collection: Identifier data keyed by the entries' current citekeys
+
+    Returns:
+        Dictionary mapping entry keys to generated labels
+    """
+    return {
+        entry.key: generate_labels_for_entry(entry, identifier_collection.get(entry.key))
+        for entry in entries
+    }
+
+
 def generate_labels(bib_path: Path, identifier_path: Path) -> dict[str, str]:
     """Generate labels for all biblatex entries.
 
@@ -220,36 +324,7 @@ def generate_labels(bib_path: Path, identifier_path: Path) -> dict[str, str]:
     labels: dict[str, str] = {}
 
     for entry_key, entry_data in entries.items():
-        # Check if shorthand field exists and use it instead of author/editor lastname
-        shorthand = entry_data.get("shorthand", "").strip()
-        if shorthand:
-            # Use shorthand directly, normalize and clean it
-            shorthand = unicodedata.normalize("NFD", shorthand)
-            shorthand = "".join(c for c in shorthand if unicodedata.category(c) != "Mn")
-            lastname = re.sub(r"[^a-zA-Z]", "", shorthand).lower() or "unknown"
-        else:
-            # Extract lastname and year - use author if available, otherwise editor
-            author_field = entry_data.get("author", "") or entry_data.get("editor", "")
-            lastname = extract_lastname(author_field, entry_data.get("sortname", ""))
-
-        year = extract_year(entry_data.get("year", ""))
-
-        # Get identifier for hashing
-        if entry_key in identifier_collection:
-            identifier_data = identifier_collection[entry_key]
-            main_identifier = identifier_data.get("main_identifier")
-            if main_identifier and main_identifier in identifier_data.get("identifiers", {}):
-                identifier_value = identifier_data["identifiers"][main_identifier]
-                hash_part = create_hash(identifier_value)
-            else:
-                # Fallback: use the entry key itself
-                hash_part = create_hash(entry_key)
-        else:
-            # Entry not found in identifier collection, use entry key
-            hash_part = create_hash(entry_key)
-
-        # Generate label
-        label = f"{lastname}-{year}-{hash_part}"
+        label = _build_label(entry_key, entry_data, identifier_collection.get(entry_key))
         labels[entry_key] = label
 
         logger.debug(f"{entry_key} -> {label}")
@@ -59,6 +59,15 @@ _SPECIAL_MACROS = {
     "\\L": "Ł",
 }
 
+# Longest macros first so that e.g. ``\oe`` wins over ``\o``; matches ``{\macro}``,
+# ``\macro{}`` and bare ``\macro`` in a single scan.
+_SPECIAL_MACRO_ALTERNATION = "|".join(
+    re.escape(macro) for macro in sorted(_SPECIAL_MACROS, key=len, reverse=True)
+)
+_SPECIAL_MACRO_PATTERN = re.compile(
+    rf"\{{({_SPECIAL_MACRO_ALTERNATION})\}}|({_SPECIAL_MACRO_ALTERNATION})(?:\{{\}})?"
+)
+
 _SINGLE_CHAR_NONASCII_BRACES = re.compile(r"\{([^{}])\}")
 
 
@@ -89,13 +98,12 @@ def normalize_latex_accents(
         FileNotFoundError: If ``library_path`` does not exist
         ValueError: If the bib file cannot be parsed
     """
-    if not library_path.exists():
-        raise FileNotFoundError(f"Bibliography file not found: {library_path}")
-
     logger.debug("Loading library for accent normalization: %s", library_path)
 
     try:
-        library: Library = bibtexparser.parse_file(str(library_path))
+        library: Library = bibtexparser.parse_file(library_path)
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(f"Bibliography file not found: {library_path}") from exc
     except Exception as exc:  # pragma: no cover - parser raises custom errors
         raise ValueError(f"Failed to parse {library_path}: {exc}") from exc
 
@@ -146,8 +154,9 @@ def _convert_value(value: str) -> str:
     updated = _BRACED_ACCENT_PATTERN.sub(_replace_accent, value)
     updated = _ACCENT_PATTERN.sub(_replace_accent, updated)
     updated = _replace_special_macros(updated)
-    updated = _strip_nonascii_single_braces(updated)
-    return updated
+    if "{" not in updated:
+        return updated
+    return _strip_nonascii_single_braces(updated)
 
 
 def _replace_accent(match: re.Match[str]) -> str:
@@ -184,15 +193,11 @@ def _resolve_base(raw: str) -> str | None:
 
 
 def _replace_special_macros(value: str) -> str:
-    updated = value
-    for macro, replacement in _SPECIAL_MACROS.items():
-        if f"{macro}{{}}" in updated:
-            updated = updated.replace(f"{macro}{{}}", replacement)
-        if f"{{{macro}}}" in updated:
-            updated = updated.replace(f"{{{macro}}}", replacement)
-        if macro in updated:
-            updated = updated.replace(macro, replacement)
-    return updated
+    return _SPECIAL_MACRO_PATTERN.sub(_replace_special_macro, value)
+
+
+def _replace_special_macro(match: re.Match[str]) -> str:
+    return _SPECIAL_MACROS[match.group(1) or match.group(2)]
 
 
 def _strip_nonascii_single_braces(value: str) -> str:
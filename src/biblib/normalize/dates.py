@@ -38,7 +38,7 @@ def rename_year_to_date_fields(
     logger.debug("Loading library for date normalization: %s", library_path)
 
     try:
-        library: Library = bibtexparser.parse_file(str(library_path))
+        library: Library = bibtexparser.parse_file(library_path)
     except Exception as exc:  # pragma: no cover - library raises many custom exceptions
         raise ValueError(f"Failed to parse {library_path}: {exc}") from exc
 
@@ -49,7 +49,7 @@ def normalize_eprint_fields(
     logger.debug("Loading library for eprint normalization: %s", library_path)
 
     try:
-        library: Library = bibtexparser.parse_file(str(library_path))
+        library: Library = bibtexparser.parse_file(library_path)
     except Exception as exc:  # pragma: no cover - parser raises custom errors
         raise ValueError(f"Failed to parse {library_path}: {exc}") from exc
 
@@ -46,7 +46,7 @@ def normalize_publisher_location(
     logger.debug("Loading library for publisher/location normalization: %s", library_path)
 
     try:
-        library: Library = bibtexparser.parse_file(str(library_path))
+        library: Library = bibtexparser.parse_file(library_path)
     except Exception as exc:  # pragma: no cover - parser raises custom errors
         raise ValueError(f"Failed to parse {library_path}: {exc}") from exc
 
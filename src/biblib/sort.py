@@ -83,7 +83,7 @@ def _sort_library_bib(library_path: Path, citekey_order: list[str]) -> None:
         citekey_order: List of citekeys in desired order
     """
     # Parse the .bib file
-    library = bibtexparser.parse_file(str(library_path))
+    library = bibtexparser.parse_file(library_path)
 
     # Create a mapping from citekey to entry for efficient lookup
     entry_map: dict[str, Entry] = {entry.key: entry for entry in library.entries}
@@ -161,6 +161,6 @@ def _sort_identifier_collection(identifier_path: Path, citekey_order: list[str])
 
     # Write back to file
     with open(identifier_path, "w", encoding="utf-8") as f:
-        json.dump(sorted_data, f, indent=2)
+        json.dump(msgspec.to_builtins(sorted_data), f, indent=2)
 
     logger.info(f"Updated {identifier_path} with {len(sorted_data)} sorted entries")
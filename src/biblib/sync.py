@@ -55,7 +55,7 @@ def load_bibtex_library(bib_path: Path) -> tuple[Library, dict[str, Entry]]:
     logger = logging.getLogger(__name__)
 
     try:
-        library = btp.parse_file(str(bib_path))
+        library = btp.parse_file(bib_path)
 
         # Create mapping from citekey to entry for easy lookup
         entry_map = {entry.key: entry for entry in library.entries}
@@ -94,13 +94,13 @@ def _process_entry_sync(
         return [], 0
 
     entry = entry_map[citekey]
-    identifiers = id_info.get("identifiers", {})
+    identifiers = id_info.identifiers
     changes: list[str] = []
     entries_modified = 0
 
     # Check each identifier field that we can sync
     for id_field_raw, id_value_raw in identifiers.items():
-        # Now we know these are strings from our TypedDict
+        # Now we know these are strings from our IdentifierData struct
         id_field: str = id_field_raw
         id_value: str = id_value_raw
 
@@ -5,6 +5,7 @@ import logging
 from pathlib import Path
 
 import bibtexparser
+import msgspec
 from bibtexparser.model import Entry
 
 from .config import WorkspaceConfig
@@ -93,10 +94,10 @@ def _create_identifier_data(entry: Entry) -> IdentifierData:
     identifiers = _extract_identifiers_from_entry(entry)
     main_identifier = _select_main_identifier(identifiers)
 
-    return {
-        "main_identifier": main_identifier or "",  # Provide empty string if None
-        "identifiers": identifiers,
-    }
+    return IdentifierData(
+        main_identifier=main_identifier or "",  # Provide empty string if None
+        identifiers=identifiers,
+    )
 
 
 def generate_identifier_template(bib_file: Path) -> dict[str, IdentifierData]:
@@ -116,7 +117,7 @@ def generate_identifier_template(bib_file: Path) -> dict[str, IdentifierData]:
 
     try:
         # Parse the .bib file
-        library = bibtexparser.parse_file(str(bib_file))
+        library = bibtexparser.parse_file(bib_file)
 
         if library.failed_blocks:
             failed_keys = [str(block) for block in library.failed_blocks]
@@ -183,7 +184,7 @@ def generate_staging_templates(workspace: Path, overwrite: bool = False) -> tupl
 
             # Write to .json file with UTF-8 encoding
             with open(json_file, "w", encoding="utf-8") as f:
-                json.dump(identifier_template, f, indent=2, ensure_ascii=False)
+                json.dump(msgspec.to_builtins(identifier_template), f, indent=2, ensure_ascii=False)
 
             generated_files.append(json_file.name)
             files_processed += 1
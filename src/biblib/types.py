@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
-from typing import TypedDict
+import msgspec
 
 
-class IdentifierData(TypedDict):
-    """Structure for identifier data entries."""
+class IdentifierData(msgspec.Struct, frozen=True, gc=False):
+    """Structure for identifier data entries.
+
+    A frozen, GC-untracked struct: msgspec decodes into it without building an
+    intermediate dict, and instances carry no per-object ``__dict__``.
+    """
 
     main_identifier: str
     identifiers: dict[str, str]
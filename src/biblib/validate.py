@@ -32,22 +32,21 @@ def extract_citekeys_from_bib(bib_path: Path) -> set[str]:
     logger.debug(f"Parsing .bib file: {bib_path}")
 
     try:
-        lib = bibtexparser.parse_file(str(bib_path))
-
-        if lib.failed_blocks:
-            failed_keys = [str(block) for block in lib.failed_blocks]
-            raise ValueError(f"Failed to parse {len(lib.failed_blocks)} blocks: {failed_keys}")
-
-        citekeys = {entry.key for entry in lib.entries}
-        logger.debug(f"Found {len(citekeys)} citekeys in {bib_path.name}")
-
-        return citekeys
-
+        lib = bibtexparser.parse_file(bib_path)
     except (OSError, PermissionError) as e:
         raise ValueError(f"Failed to read {bib_path}: {e}") from e
     except UnicodeDecodeError as e:
         raise ValueError(f"Failed to decode {bib_path}: {e}") from e
 
+    if lib.failed_blocks:
+        failed_keys = [str(block) for block in lib.failed_blocks]
+        raise ValueError(f"Failed to parse {len(lib.failed_blocks)} blocks: {failed_keys}")
+
+    citekeys = {entry.key for entry in lib.entries}
+    logger.debug(f"Found {len(citekeys)} citekeys in {bib_path.name}")
+
+    return citekeys
+
 
 def extract_citekeys_from_add_order(add_order_path: Path) -> set[str]:
     """Extract citekeys from add_order.json.
@@ -68,17 +67,13 @@ def extract_citekeys_from_add_order(add_order_path: Path) -> set[str]:
     logger.debug(f"Reading add order file: {add_order_path}")
 
     try:
-        with open(add_order_path, encoding="utf-8") as f:
-            data = json.load(f)
-
-        # Use msgspec for direct type-safe validation
-        data_list = msgspec.convert(data, type=list[str])
-        citekeys = set(data_list)
+        # Parse and validate in one pass, straight into a set
+        citekeys = msgspec.json.decode(add_order_path.read_bytes(), type=set[str])
         logger.debug(f"Found {len(citekeys)} citekeys in {add_order_path.name}")
 
         return citekeys
 
-    except json.JSONDecodeError as e:
+    except msgspec.DecodeError as e:
         raise ValueError(f"Invalid JSON in {add_order_path}: {e}") from e
 
 
@@ -101,17 +96,16 @@ def extract_citekeys_from_identifier_collection(identifier_path: Path) -> set[st
     logger.debug(f"Reading identifier collection file: {identifier_path}")
 
     try:
-        with open(identifier_path, encoding="utf-8") as f:
-            data = json.load(f)
-
-        # Use msgspec for direct type-safe validation
-        data_dict = msgspec.convert(data, type=dict[str, IdentifierData])
-        citekeys = set(data_dict.keys())
+        # Parse and validate in one pass; values are still checked against the schema
+        data_dict = msgspec.json.decode(
+            identifier_path.read_bytes(), type=dict[str, IdentifierData]
+        )
+        citekeys = set(data_dict)
         logger.debug(f"Found {len(citekeys)} citekeys in {identifier_path.name}")
 
         return citekeys
 
-    except json.JSONDecodeError as e:
+    except msgspec.DecodeError as e:
         raise ValueError(f"Invalid JSON in {identifier_path}: {e}") from e
 
 
@@ -377,6 +371,6 @@ def _fix_identifier_collection_file(identifier_path: Path, replacement_map: dict
 
         # Write back the modified data
         with open(identifier_path, "w", encoding="utf-8") as f:
-            json.dump(new_data, f, indent=2, ensure_ascii=False)
+            json.dump(msgspec.to_builtins(new_data), f, indent=2, ensure_ascii=False)
     else:
         raise ValueError(f"Expected dict in {identifier_path}, got {type(data).__name__}")
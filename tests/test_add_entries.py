@@ -1,15 +1,37 @@
 """Tests for adding new entries from staging files."""
 
 import json
+import logging
+import os
 import tempfile
 from pathlib import Path
+from typing import BinaryIO
 from unittest.mock import patch
 
+import bibtexparser
+import msgspec
+import pytest
+
 from biblib.add_entries import (
+    STAGING_PATTERN,
     add_entries_from_staging,
+    append_to_files,
     find_staging_pairs,
+    load_existing_keys,
     process_staging_entry,
+    process_staging_pairs,
 )
+from biblib.config import WorkspaceConfig
+from biblib.exceptions import FileOperationError, InvalidDataError
+from biblib.types import IdentifierData
+
+
+def test_staging_pattern_is_anchored():
+    """Test that the public pattern only accepts whole staging file names."""
+    assert STAGING_PATTERN.match("2025-01-01-x.bib")
+    assert STAGING_PATTERN.fullmatch("2025-01-01-x.json")
+    assert not STAGING_PATTERN.match("2025-01-01-x.bibfoo")
+    assert not STAGING_PATTERN.search("notes-2025-01-01-x.bib")
 
 
 def test_find_staging_pairs():
@@ -65,8 +87,8 @@ def test_process_staging_entry_success():
         # Mock existing data files (empty)
         existing_keys: set[str] = set()
 
-        with patch("biblib.add_entries.generate_labels") as mock_gen:
-            mock_gen.return_value = {"temp-key": "smith-2025-abc123"}
+        with patch("biblib.add_entries.generate_labels_for_entry") as mock_gen:
+            mock_gen.return_value = "smith-2025-abc123"
 
             result = process_staging_entry(
                 slug="test", bib_path=bib_file, json_path=json_file, existing_keys=existing_keys
@@ -107,8 +129,8 @@ def test_process_staging_entry_duplicate_key():
         # Mock existing data with duplicate key
         existing_keys = {"smith-2025-abc123"}
 
-        with patch("biblib.add_entries.generate_labels") as mock_gen:
-            mock_gen.return_value = {"temp-key": "smith-2025-abc123"}
+        with patch("biblib.add_entries.generate_labels_for_entry") as mock_gen:
+            mock_gen.return_value = "smith-2025-abc123"
 
             result = process_staging_entry(
                 slug="test", bib_path=bib_file, json_path=json_file, existing_keys=existing_keys
@@ -149,10 +171,10 @@ def test_add_entries_from_staging_integration():
         (workspace / "data" / "identifier_collection.json").write_text("{}", encoding="utf-8")
 
         with (
-            patch("biblib.add_entries.generate_labels") as mock_gen,
+            patch("biblib.add_entries.generate_labels_for_entry") as mock_gen,
             patch("biblib.add_entries.load_existing_keys") as mock_load,
         ):
-            mock_gen.return_value = {"temp-key": "smith-2025-abc123"}
+            mock_gen.return_value = "smith-2025-abc123"
             mock_load.return_value = set()
 
             # Mock the file operations since we're testing logic, not I/O
@@ -180,10 +202,8 @@ def test_invalid_staging_files():
         pairs = find_staging_pairs(staging)
         assert len(pairs) == 1  # Should find the pair
 
-        # Processing should handle the invalid content gracefully
-        with patch("biblib.add_entries.generate_labels") as mock_gen:
-            mock_gen.side_effect = ValueError("Invalid bib format")
-
+        # A file without any entry is skipped before labels are generated
+        with patch("biblib.add_entries.generate_labels_for_entry") as mock_gen:
             result = process_staging_entry(
                 slug="invalid",
                 bib_path=staging / "2025-01-15-invalid.bib",
@@ -191,7 +211,49 @@ def test_invalid_staging_files():
                 existing_keys=set(),
             )
 
-            assert result is None  # Should return None on error
+            assert result is None
+            mock_gen.assert_not_called()
+
+
+def test_label_error_skips_only_that_entry():
+    """Test that a label generation error drops one entry and keeps the rest of the pair."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Path(tmpdir)
+
+        bib_file = workspace / "test.bib"
+        json_file = workspace / "test.json"
+        bib_file.write_text(
+            "@article{bad-key,\n  title = {Bad}\n}\n\n@article{good-key,\n  title = {Good}\n}\n",
+            encoding="utf-8",
+        )
+        json_file.write_text(
+            json.dumps(
+                {
+                    key: {"main_identifier": "doi", "identifiers": {"doi": f"10.1000/{key}"}}
+                    for key in ("bad-key", "good-key")
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        def label_for(entry: bibtexparser.model.Entry, identifier_data: IdentifierData) -> str:
+            if entry.key == "bad-key":
+                raise ValueError("Invalid bib format")
+            return "good-2025-abc123"
+
+        with patch("biblib.add_entries.generate_labels_for_entry", side_effect=label_for):
+            result = process_staging_entry("test", bib_file, json_file, set())
+
+        assert result is not None
+        key_mapping, entry_data, _ = result
+        assert key_mapping == {"good-key": "good-2025-abc123"}
+        assert list(entry_data) == ["good-2025-abc123"]
+
+        # When every entry fails, the whole pair is skipped
+        with patch(
+            "biblib.add_entries.generate_labels_for_entry", side_effect=ValueError("Invalid")
+        ):
+            assert process_staging_entry("test", bib_file, json_file, set()) is None
 
 
 def test_real_label_generation_integration():
@@ -376,7 +438,464 @@ def test_process_staging_entry_multiple_entries():
         assert new_key_2 in identifier_data
 
         # Verify the data integrity
-        assert identifier_data[new_key_1]["main_identifier"] == "doi"
-        assert identifier_data[new_key_1]["identifiers"]["doi"] == "10.24033/asens.2258"
-        assert identifier_data[new_key_2]["main_identifier"] == "doi"
-        assert identifier_data[new_key_2]["identifiers"]["doi"] == "10.1007/s00220-024-05114-3"
+        assert identifier_data[new_key_1].main_identifier == "doi"
+        assert identifier_data[new_key_1].identifiers["doi"] == "10.24033/asens.2258"
+        assert identifier_data[new_key_2].main_identifier == "doi"
+        assert identifier_data[new_key_2].identifiers["doi"] == "10.1007/s00220-024-05114-3"
+
+
+def test_append_to_files_writes_all_three_files():
+    """Test that appended entries land in library.bib and both JSON files."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Path(tmpdir)
+        (workspace / "bib").mkdir()
+        (workspace / "data").mkdir()
+
+        bib_path = workspace / "bib" / "library.bib"
+        identifier_path = workspace / "data" / "identifier_collection.json"
+        add_order_path = workspace / "data" / "add_order.json"
+
+        bib_path.write_text("@article{old-2020-aaaaaaaa,\n  title = {Old},\n}\n", encoding="utf-8")
+        existing_ids = {
+            "old-2020-aaaaaaaa": {"main_identifier": "doi", "identifiers": {"doi": "10.1/old"}}
+        }
+        identifier_path.write_text(json.dumps(existing_ids, indent=2), encoding="utf-8")
+        add_order_path.write_text(json.dumps(["old-2020-aaaaaaaa"], indent=2), encoding="utf-8")
+
+        entry = bibtexparser.parse_string(
+            "@article{new-2025-bbbbbbbb,\n  title = {Nëw},\n}\n"
+        ).entries[0]
+        new_ids = {
+            "new-2025-bbbbbbbb": IdentifierData(
+                main_identifier="doi", identifiers={"doi": "10.1/nëw"}
+            )
+        }
+
+        success = append_to_files(
+            [("new-2025-bbbbbbbb", {"new-2025-bbbbbbbb": entry}, new_ids)],
+            bib_path,
+            identifier_path,
+            add_order_path,
+        )
+
+        assert success is True
+        keys = [e.key for e in bibtexparser.parse_file(str(bib_path)).entries]
+        assert keys == ["old-2020-aaaaaaaa", "new-2025-bbbbbbbb"]
+
+        expected_ids = {**existing_ids, **msgspec.to_builtins(new_ids)}
+        expected_order = ["old-2020-aaaaaaaa", "new-2025-bbbbbbbb"]
+        assert identifier_path.read_text(encoding="utf-8") == json.dumps(
+            expected_ids, indent=2, ensure_ascii=False
+        )
+        assert add_order_path.read_text(encoding="utf-8") == json.dumps(
+            expected_order, indent=2, ensure_ascii=False
+        )
+        assert list((workspace / "staging").glob("backup-*"))
+
+
+def test_append_to_files_failed_write_leaves_library_intact():
+    """Test that a failure mid-write leaves all three data files byte-identical."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Path(tmpdir)
+        (workspace / "bib").mkdir()
+        (workspace / "data").mkdir()
+
+        bib_path = workspace / "bib" / "library.bib"
+        identifier_path = workspace / "data" / "identifier_collection.json"
+        add_order_path = workspace / "data" / "add_order.json"
+
+        original_bib = "@article{old-2020-aaaaaaaa,\n  title = {Old},\n}\n"
+        bib_path.write_text(original_bib, encoding="utf-8")
+        identifier_path.write_text("{}", encoding="utf-8")
+        add_order_path.write_text("[]", encoding="utf-8")
+
+        entry = bibtexparser.parse_string("@article{new-2025-bbbbbbbb,\n  title = {New},\n}\n")
+        new_ids = {
+            "new-2025-bbbbbbbb": IdentifierData(main_identifier="doi", identifiers={"doi": "x"})
+        }
+
+        paths = (bib_path, identifier_path, add_order_path)
+        before = [path.read_bytes() for path in paths]
+
+        with (
+            patch("biblib.add_entries._write_bib_streaming", side_effect=RuntimeError("boom")),
+            pytest.raises(FileOperationError),
+        ):
+            append_to_files(
+                [("new-2025-bbbbbbbb", {"new-2025-bbbbbbbb": entry.entries[0]}, new_ids)],
+                bib_path,
+                identifier_path,
+                add_order_path,
+            )
+
+        assert [path.read_bytes() for path in paths] == before
+
+
+def test_append_to_files_failed_add_order_write_keeps_files_consistent():
+    """Test that failing to replace add_order.json rolls back the other two files too."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Path(tmpdir)
+        (workspace / "bib").mkdir()
+        (workspace / "data").mkdir()
+
+        bib_path = workspace / "bib" / "library.bib"
+        identifier_path = workspace / "data" / "identifier_collection.json"
+        add_order_path = workspace / "data" / "add_order.json"
+
+        bib_path.write_text("@article{old-2020-aaaaaaaa,\n  title = {Old},\n}\n", encoding="utf-8")
+        identifier_path.write_text(
+            json.dumps(
+                {"old-2020-aaaaaaaa": {"main_identifier": "doi", "identifiers": {"doi": "o"}}},
+                indent=2,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+        add_order_path.write_text('[\n  "old-2020-aaaaaaaa"\n]\n', encoding="utf-8")
+
+        entry = bibtexparser.parse_string("@article{new-2025-bbbbbbbb,\n  title = {New},\n}\n")
+        new_ids = {
+            "new-2025-bbbbbbbb": IdentifierData(main_identifier="doi", identifiers={"doi": "x"})
+        }
+
+        paths = (bib_path, identifier_path, add_order_path)
+        before = [path.read_bytes() for path in paths]
+
+        real_replace = os.replace
+
+        def failing_replace(src: Path, dst: Path) -> None:
+            if Path(dst) == add_order_path:
+                raise OSError("disk full")
+            real_replace(src, dst)
+
+        with (
+            patch("biblib.add_entries.os.replace", side_effect=failing_replace),
+            pytest.raises(FileOperationError),
+        ):
+            append_to_files(
+                [("new-2025-bbbbbbbb", {"new-2025-bbbbbbbb": entry.entries[0]}, new_ids)],
+                bib_path,
+                identifier_path,
+                add_order_path,
+            )
+
+        assert [path.read_bytes() for path in paths] == before
+        assert not list((workspace / "data").glob("*.tmp"))
+
+
+def test_process_staging_pairs_deduplicates_across_pairs(caplog: pytest.LogCaptureFixture):
+    """Test that later pairs lose duplicate keys and every skip is logged in this process."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        staging = Path(tmpdir)
+        dois = ["10.1000/a", "10.1000/b", "10.1000/a", "10.1000/c", None]
+
+        pairs: list[tuple[str, Path, Path]] = []
+        for i, doi in enumerate(dois):
+            slug = f"2025-01-0{i + 1}-pair"
+            bib_file = staging / f"{slug}.bib"
+            json_file = staging / f"{slug}.json"
+            bib_file.write_text(
+                f"@article{{tmp{i},\n  author = {{Smith, John}},\n  year = {{2025}},\n}}\n",
+                encoding="utf-8",
+            )
+            # The last pair has no identifier data for its entry
+            identifiers = (
+                {f"tmp{i}": {"main_identifier": "doi", "identifiers": {"doi": doi}}} if doi else {}
+            )
+            json_file.write_text(json.dumps(identifiers), encoding="utf-8")
+            pairs.append((slug, bib_file, json_file))
+
+        existing_keys: set[str] = set()
+        with caplog.at_level(logging.INFO, logger="biblib.add_entries"):
+            new_entries, processed_slugs = process_staging_pairs(pairs, existing_keys)
+
+        # The third pair repeats the first DOI, so its key is a duplicate
+        assert processed_slugs == ["2025-01-01-pair", "2025-01-02-pair", "2025-01-04-pair"]
+        new_keys = [key for key, _, _ in new_entries]
+        assert len(new_keys) == len(set(new_keys)) == 3
+        assert existing_keys == set(new_keys)
+        for key, entry_data, _ in new_entries:
+            assert entry_data[key].key == key
+
+        messages = [record.getMessage() for record in caplog.records]
+        assert "Entry key 'tmp4' not found in identifier data" in messages
+        assert "No entries were successfully processed from 2025-01-05-pair" in messages
+        # Only accepted keys are reported as generated
+        generated = [m for m in messages if m.startswith("Generated new key")]
+        assert len(generated) == 3
+
+        # Keys already in the library are rejected too
+        library_key = new_keys[-1]
+        new_entries, processed_slugs = process_staging_pairs(pairs, {library_key})
+        assert processed_slugs == ["2025-01-01-pair", "2025-01-02-pair"]
+        assert library_key not in [key for key, _, _ in new_entries]
+
+
+def test_load_existing_keys_uses_stat_cache():
+    """Test that existing keys are cached until one of the data files changes."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Path(tmpdir)
+        (workspace / "bib").mkdir()
+        (workspace / "data").mkdir()
+        config = WorkspaceConfig.from_workspace(workspace)
+
+        config.bib_path.write_text("@article{a-2020-aaaaaaaa,\n}\n", encoding="utf-8")
+        config.identifier_path.write_text("{}", encoding="utf-8")
+        config.add_order_path.write_text('["a-2020-aaaaaaaa"]', encoding="utf-8")
+
+        def scan_bib_keys(bib_path: Path) -> set[str]:
+            return {"a-2020-aaaaaaaa"}
+
+        with patch("biblib.add_entries._scan_bib_keys", side_effect=scan_bib_keys) as mock_scan:
+            # Cache miss: the bib is scanned and the cache written
+            assert load_existing_keys(config) == {"a-2020-aaaaaaaa"}
+            assert (config.cache_dir / "existing_keys.msgpack").exists()
+            mock_scan.assert_called_once_with(config.bib_path)
+
+            # Cache hit: the bib is not read again
+            mock_scan.reset_mock()
+            assert load_existing_keys(config) == {"a-2020-aaaaaaaa"}
+            mock_scan.assert_not_called()
+
+            # A changed data file invalidates the cache
+            config.add_order_path.write_text(
+                '["a-2020-aaaaaaaa", "b-2021-bbbbbbbb"]', encoding="utf-8"
+            )
+            assert load_existing_keys(config) == {"a-2020-aaaaaaaa", "b-2021-bbbbbbbb"}
+            mock_scan.assert_called_once_with(config.bib_path)
+
+
+@pytest.mark.parametrize(
+    "original_bib",
+    [
+        "",
+        "@article{old-2020-aaaaaaaa,\n\ttitle = {Old}\n}\n",
+        "@article{old-2020-aaaaaaaa,\n\ttitle = {Old}\n}",  # no trailing newline
+    ],
+)
+def test_append_to_files_matches_full_rewrite(original_bib: str):
+    """Test that appending to library.bib gives the same bytes as re-writing it."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Path(tmpdir)
+        (workspace / "bib").mkdir()
+        (workspace / "data").mkdir()
+
+        bib_path = workspace / "bib" / "library.bib"
+        bib_path.write_text(original_bib, encoding="utf-8")
+
+        new_bib = "@article{new-2025-bbbbbbbb,\n  title = {New},\n}\n"
+        expected_library = bibtexparser.parse_string(original_bib)
+        expected_library.add(bibtexparser.parse_string(new_bib).entries[0])
+
+        entry = bibtexparser.parse_string(new_bib).entries[0]
+        new_ids = {
+            "new-2025-bbbbbbbb": IdentifierData(main_identifier="doi", identifiers={"doi": "x"})
+        }
+        success = append_to_files(
+            [("new-2025-bbbbbbbb", {"new-2025-bbbbbbbb": entry}, new_ids)],
+            bib_path,
+            workspace / "data" / "identifier_collection.json",
+            workspace / "data" / "add_order.json",
+        )
+
+        assert success is True
+        assert bib_path.read_text(encoding="utf-8") == bibtexparser.write_string(expected_library)
+
+
+def test_load_existing_keys_skips_non_entry_blocks():
+    """Test that the citekey scan ignores @string/@comment/@preamble blocks."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Path(tmpdir)
+        (workspace / "bib").mkdir()
+        config = WorkspaceConfig.from_workspace(workspace)
+
+        bib_content = """@string{jams = "J. Amer. Math. Soc."}
+@comment{not-a-key, just text}
+@preamble{"\\newcommand{\\noop}[1]{}"}
+@article{a-2020-aaaaaaaa,
+  journal = jams,
+}
+  @Book( b-2021-bbbbbbbb ,
+  title = {B},
+)
+@misc{
+  c-2022-cccccccc,
+}
+"""
+        config.bib_path.write_text(bib_content, encoding="utf-8")
+
+        expected = {e.key for e in bibtexparser.parse_file(str(config.bib_path)).entries}
+        assert expected == {"a-2020-aaaaaaaa", "b-2021-bbbbbbbb", "c-2022-cccccccc"}
+        assert load_existing_keys(config) == expected
+
+
+def test_append_to_files_patches_json_tails_in_place():
+    """Test that existing JSON bytes, including a trailing newline, are kept as they are."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Path(tmpdir)
+        (workspace / "bib").mkdir()
+        (workspace / "data").mkdir()
+
+        identifier_path = workspace / "data" / "identifier_collection.json"
+        add_order_path = workspace / "data" / "add_order.json"
+        existing_ids: dict[str, object] = {
+            "old-2020-aaaaaaaa": {"main_identifier": "doi", "identifiers": {}}
+        }
+        identifier_path.write_text(json.dumps(existing_ids, indent=2) + "\n", encoding="utf-8")
+        add_order_path.write_text(json.dumps(["old-2020-aaaaaaaa"], indent=2) + "\n")
+
+        entry = bibtexparser.parse_string("@misc{new-2025-bbbbbbbb,\n}\n").entries[0]
+        new_ids = {"new-2025-bbbbbbbb": IdentifierData(main_identifier="arxiv", identifiers={})}
+        append_to_files(
+            [("new-2025-bbbbbbbb", {"new-2025-bbbbbbbb": entry}, new_ids)],
+            workspace / "bib" / "library.bib",
+            identifier_path,
+            add_order_path,
+        )
+
+        expected_ids = {**existing_ids, **msgspec.to_builtins(new_ids)}
+        expected_order = ["old-2020-aaaaaaaa", "new-2025-bbbbbbbb"]
+        assert (
+            identifier_path.read_text(encoding="utf-8") == json.dumps(expected_ids, indent=2) + "\n"
+        )
+        assert (
+            add_order_path.read_text(encoding="utf-8")
+            == json.dumps(expected_order, indent=2) + "\n"
+        )
+
+
+@pytest.mark.parametrize("indent", [4, "\t"])
+def test_append_to_files_rewrites_json_with_other_indent(indent: int | str):
+    """Test that JSON files not indented by two spaces are re-encoded instead of spliced."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Path(tmpdir)
+        (workspace / "bib").mkdir()
+        (workspace / "data").mkdir()
+
+        identifier_path = workspace / "data" / "identifier_collection.json"
+        add_order_path = workspace / "data" / "add_order.json"
+        existing_ids: dict[str, object] = {
+            "old-2020-aaaaaaaa": {"main_identifier": "doi", "identifiers": {}}
+        }
+        identifier_path.write_text(json.dumps(existing_ids, indent=indent), encoding="utf-8")
+        add_order_path.write_text(json.dumps(["old-2020-aaaaaaaa"], indent=indent))
+
+        entry = bibtexparser.parse_string("@misc{new-2025-bbbbbbbb,\n}\n").entries[0]
+        new_ids = {"new-2025-bbbbbbbb": IdentifierData(main_identifier="arxiv", identifiers={})}
+        append_to_files(
+            [("new-2025-bbbbbbbb", {"new-2025-bbbbbbbb": entry}, new_ids)],
+            workspace / "bib" / "library.bib",
+            identifier_path,
+            add_order_path,
+        )
+
+        expected_ids = {**existing_ids, **msgspec.to_builtins(new_ids)}
+        expected_order = ["old-2020-aaaaaaaa", "new-2025-bbbbbbbb"]
+        assert identifier_path.read_text(encoding="utf-8") == json.dumps(expected_ids, indent=2)
+        assert add_order_path.read_text(encoding="utf-8") == json.dumps(expected_order, indent=2)
+
+
+def test_append_to_files_readding_key_updates_without_duplicates():
+    """Test that re-adding a key replaces its identifiers and is not re-recorded in add order."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Path(tmpdir)
+        (workspace / "bib").mkdir()
+        (workspace / "data").mkdir()
+
+        identifier_path = workspace / "data" / "identifier_collection.json"
+        identifier_path.write_text(
+            json.dumps(
+                {"key-2020-aaaaaaaa": {"main_identifier": "doi", "identifiers": {}}}, indent=2
+            ),
+            encoding="utf-8",
+        )
+        add_order_path = workspace / "data" / "add_order.json"
+        add_order_path.write_text(json.dumps(["key-2020-aaaaaaaa"], indent=2), encoding="utf-8")
+
+        entry = bibtexparser.parse_string("@misc{key-2020-aaaaaaaa,\n}\n").entries[0]
+        new_ids = {"key-2020-aaaaaaaa": IdentifierData(main_identifier="arxiv", identifiers={})}
+        append_to_files(
+            [("key-2020-aaaaaaaa", {"key-2020-aaaaaaaa": entry}, new_ids)],
+            workspace / "bib" / "library.bib",
+            identifier_path,
+            add_order_path,
+        )
+
+        assert identifier_path.read_text(encoding="utf-8") == json.dumps(
+            msgspec.to_builtins(new_ids), indent=2
+        )
+        assert json.loads(add_order_path.read_text(encoding="utf-8")) == ["key-2020-aaaaaaaa"]
+
+
+def test_append_to_files_rolls_back_unverifiable_append():
+    """Test that an append which does not parse back is truncated away."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Path(tmpdir)
+        (workspace / "bib").mkdir()
+        (workspace / "data").mkdir()
+
+        bib_path = workspace / "bib" / "library.bib"
+        original_bib = "@article{old-2020-aaaaaaaa,\n\ttitle = {Old}\n}\n"
+        bib_path.write_text(original_bib, encoding="utf-8")
+
+        entry = bibtexparser.parse_string("@misc{new-2025-bbbbbbbb,\n}\n").entries[0]
+        new_ids = {"new-2025-bbbbbbbb": IdentifierData(main_identifier="arxiv", identifiers={})}
+
+        # Simulate the writer emitting something other than the entry it was given
+        def write_garbage(_blocks: object, f: BinaryIO) -> None:
+            f.write(b"@misc{other-key,\n}\n")
+
+        with (
+            patch("biblib.add_entries._write_bib_streaming", side_effect=write_garbage),
+            pytest.raises(InvalidDataError),
+        ):
+            append_to_files(
+                [("new-2025-bbbbbbbb", {"new-2025-bbbbbbbb": entry}, new_ids)],
+                bib_path,
+                workspace / "data" / "identifier_collection.json",
+                workspace / "data" / "add_order.json",
+            )
+
+        assert bib_path.read_text(encoding="utf-8") == original_bib
+        assert not (workspace / "data" / "add_order.json").exists()
+
+
+def test_append_to_files_rejects_key_already_in_library():
+    """Test that an entry whose key is already in library.bib is not appended again."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Path(tmpdir)
+        (workspace / "bib").mkdir()
+        (workspace / "data").mkdir()
+
+        bib_path = workspace / "bib" / "library.bib"
+        original_bib = "@article{old-2020-aaaaaaaa,\n\ttitle = {Old}\n}\n"
+        bib_path.write_text(original_bib, encoding="utf-8")
+
+        entry = bibtexparser.parse_string("@misc{old-2020-aaaaaaaa,\n}\n").entries[0]
+        new_ids = {"old-2020-aaaaaaaa": IdentifierData(main_identifier="arxiv", identifiers={})}
+
+        with pytest.raises(InvalidDataError, match="already in"):
+            append_to_files(
+                [("old-2020-aaaaaaaa", {"old-2020-aaaaaaaa": entry}, new_ids)],
+                bib_path,
+                workspace / "data" / "identifier_collection.json",
+                workspace / "data" / "add_order.json",
+            )
+
+        assert bib_path.read_text(encoding="utf-8") == original_bib
+
+
+def test_add_entries_from_staging_with_nothing_staged_reads_no_data():
+    """Test that an empty staging directory returns before any data file is loaded."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Path(tmpdir)
+        (workspace / "staging").mkdir()
+        (workspace / "staging" / "notes.txt").write_text("not a staging file", encoding="utf-8")
+
+        with (
+            patch("biblib.add_entries.load_existing_keys") as mock_keys,
+            patch("biblib.add_entries.create_backup") as mock_backup,
+        ):
+            assert add_entries_from_staging(workspace) == (True, [])
+            mock_keys.assert_not_called()
+            mock_backup.assert_not_called()
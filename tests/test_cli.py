@@ -0,0 +1,150 @@
+"""Tests for the command-line interface."""
+
+import argparse
+import logging
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from biblib.cli import cmd_normalize, create_parser, main, setup_logging
+
+_BIB_WITH_YEAR = """@book{entry-one,
+  title = {First Book},
+  year = {2020}
+}
+"""
+
+
+def _write_workspace(workspace: Path) -> Path:
+    bib_path = workspace / "bib" / "library.bib"
+    bib_path.parent.mkdir()
+    bib_path.write_text(_BIB_WITH_YEAR, encoding="utf-8")
+    return bib_path
+
+
+@pytest.mark.parametrize(
+    ("verbosity", "level"),
+    [(0, logging.WARNING), (1, logging.INFO), (2, logging.DEBUG), (5, logging.DEBUG)],
+)
+def test_setup_logging_maps_verbosity_to_level(verbosity: int, level: int):
+    """Test that each -v step lowers the log level, with -vv and beyond reaching DEBUG."""
+    with patch("biblib.cli.logging.basicConfig") as mock_config:
+        setup_logging(verbosity)
+
+    assert mock_config.call_args.kwargs["level"] == level
+
+
+@pytest.mark.parametrize("dry_run", [False, True])
+def test_normalize_handler_returns_success(tmp_path: Path, dry_run: bool):
+    """Test that a normalize action runs through the dispatch table and returns 0."""
+    bib_path = _write_workspace(tmp_path)
+    argv = ["--workspace", str(tmp_path), "normalize", "year-to-date"]
+    args = create_parser().parse_args(argv + ["--dry-run"] if dry_run else argv)
+
+    assert args.func(args) == 0
+
+    text = bib_path.read_text(encoding="utf-8")
+    if dry_run:
+        assert text == _BIB_WITH_YEAR
+    else:
+        assert "date = {2020}" in text
+        assert "year" not in text
+
+
+def test_normalize_missing_library_returns_failure(tmp_path: Path):
+    """Test that a missing library.bib is reported with exit code 1."""
+    args = create_parser().parse_args(["--workspace", str(tmp_path), "normalize", "latex-accents"])
+
+    assert args.func(args) == 1
+
+
+def test_normalize_unknown_action_fails(tmp_path: Path):
+    """Test that unknown normalize actions are rejected by the parser and the handler."""
+    with pytest.raises(SystemExit) as exc_info:
+        create_parser().parse_args(["normalize", "bogus"])
+    assert exc_info.value.code == 2
+
+    args = argparse.Namespace(workspace=str(tmp_path), action="bogus", dry_run=False, verbose=0)
+    assert cmd_normalize(args) == 1
+
+
+def test_main_exits_with_handler_code(tmp_path: Path):
+    """Test that main() exits with the code returned by the subcommand handler."""
+    _write_workspace(tmp_path)
+
+    argv = ["blx", "--workspace", str(tmp_path), "normalize", "year-to-date", "--dry-run"]
+    with (
+        patch("biblib.cli.setup_logging"),
+        patch("sys.argv", argv),
+        pytest.raises(SystemExit) as exc_info,
+    ):
+        main()
+    assert exc_info.value.code == 0
+
+    # No subcommand prints the help and fails
+    with (
+        patch("biblib.cli.setup_logging"),
+        patch("sys.argv", ["blx"]),
+        pytest.raises(SystemExit) as exc_info,
+    ):
+        main()
+    assert exc_info.value.code == 1
+
+
+def test_normalize_eprint_details_logged_once(tmp_path: Path, caplog: pytest.LogCaptureFixture):
+    """Test that the eprint per-category details and previews form a single log record."""
+    bib_path = tmp_path / "bib" / "library.bib"
+    bib_path.parent.mkdir()
+    bib_path.write_text(
+        """@article{entry-one,
+  title = {Paper},
+  eprint = {2101.00001},
+  archiveprefix = {arXiv},
+  primaryclass = {math.AT}
+}
+""",
+        encoding="utf-8",
+    )
+    argv = ["-v", "--workspace", str(tmp_path), "normalize", "eprint-fields", "--dry-run"]
+    args = create_parser().parse_args(argv)
+
+    with caplog.at_level(logging.INFO, logger="biblib.cli"):
+        assert args.func(args) == 0
+
+    messages = [r.getMessage() for r in caplog.records if r.name == "biblib.cli"]
+    assert len(messages) == 2
+    assert messages[1].splitlines() == [
+        "Renamed archiveprefix→eprinttype for 1 entries",
+        "  entry-one",
+        "Renamed primaryclass→eprintclass for 1 entries",
+        "  entry-one",
+        "Lowercased eprinttype for 1 entries",
+        "  entry-one",
+    ]
+
+
+def test_add_key_clash_returns_failure(tmp_path: Path, caplog: pytest.LogCaptureFixture):
+    """Test that a citekey already in library.bib is reported with exit code 1."""
+    bib_path = _write_workspace(tmp_path)
+    staging = tmp_path / "staging"
+    staging.mkdir()
+    (staging / "2025-01-01-clash.bib").write_text(
+        "@book{tmp,\n  title = {Second Book},\n  year = {2021}\n}\n", encoding="utf-8"
+    )
+    (staging / "2025-01-01-clash.json").write_text(
+        '{"tmp": {"main_identifier": "isbn", "identifiers": {}}}', encoding="utf-8"
+    )
+    args = create_parser().parse_args(["--workspace", str(tmp_path), "add"])
+
+    # A stale key set lets the clash through to append_to_files
+    with (
+        patch("biblib.add_entries.load_existing_keys", return_value=set()),
+        patch("biblib.add_entries.generate_labels_for_entry", return_value="entry-one"),
+        caplog.at_level(logging.ERROR, logger="biblib.cli"),
+    ):
+        assert args.func(args) == 1
+
+    assert "Citekeys already in" in caplog.text
+    assert bib_path.read_text(encoding="utf-8") == _BIB_WITH_YEAR
+    assert (staging / "2025-01-01-clash.bib").exists()
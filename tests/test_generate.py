@@ -4,14 +4,20 @@ import json
 import tempfile
 from pathlib import Path
 
+import bibtexparser
+import msgspec
+import pytest
+
 from biblib.generate import (
     create_hash,
     extract_lastname,
     extract_year,
     generate_labels,
+    generate_labels_for_entry,
     load_identifier_collection,
     parse_bib_entries,
 )
+from biblib.types import IdentifierData
 
 
 def test_extract_lastname():
@@ -149,8 +155,8 @@ def test_load_identifier_collection():
 
         assert len(collection) == 2
         assert "test-key-1" in collection
-        assert collection["test-key-1"]["main_identifier"] == "doi"
-        assert collection["test-key-1"]["identifiers"]["doi"] == "10.1000/test1"
+        assert collection["test-key-1"].main_identifier == "doi"
+        assert collection["test-key-1"].identifiers["doi"] == "10.1000/test1"
 
     finally:
         identifier_path.unlink()
@@ -247,3 +253,53 @@ def test_generate_labels_fallbacks():
         # Second entry should handle missing year and use entry key for hash
         label2 = labels["test-key-2"]
         assert label2.startswith("author-unknown-")
+
+
+def test_generate_labels_for_entry_matches_file_based():
+    """Test that in-memory label generation matches the file-based path."""
+    bib_text = """
+@book{original-key-1,
+  author = {Bredon, Glen E.},
+  title = {Test Book},
+  year = {1993},
+}
+"""
+    identifier = IdentifierData(
+        main_identifier="doi", identifiers={"doi": "10.1007/978-1-4757-6848-0"}
+    )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        bib_path = temp_path / "test.bib"
+        bib_path.write_text(bib_text, encoding="utf-8")
+        identifier_path = temp_path / "identifiers.json"
+        identifier_path.write_bytes(msgspec.json.encode({"original-key-1": identifier}))
+
+        expected = generate_labels(bib_path, identifier_path)["original-key-1"]
+
+    entry = bibtexparser.parse_string(bib_text).entries[0]
+    assert generate_labels_for_entry(entry, identifier) == expected == "bredon-1993-7908a921"
+
+    # Without identifier data the entry key is hashed instead
+    assert generate_labels_for_entry(entry, None) == f"bredon-1993-{create_hash('original-key-1')}"
+
+
+def test_missing_files_raise_file_not_found():
+    """Test that missing inputs still raise FileNotFoundError with a clear message."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        missing = Path(temp_dir) / "missing"
+
+        with pytest.raises(FileNotFoundError, match="Bibliography file not found"):
+            parse_bib_entries(missing)
+
+        with pytest.raises(FileNotFoundError, match="Identifier collection file not found"):
+            load_identifier_collection(missing)
+
+
+def test_generate_labels_for_entry_uses_folded_shorthand():
+    """Test that a shorthand replaces the author name and is folded like a last name."""
+    entry = bibtexparser.parse_string(
+        "@book{key,\n  author = {Bredon, Glen E.},\n  shorthand = {SGA-Ém},\n  year = {1993}\n}\n"
+    ).entries[0]
+
+    assert generate_labels_for_entry(entry, None) == f"sgaem-1993-{create_hash('key')}"
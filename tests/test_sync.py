@@ -95,11 +95,10 @@ class TestLoadIdentifierCollection:
         assert len(data) == 4
         assert "test-entry-1" in data
         entry_data = data["test-entry-1"]
-        assert entry_data["main_identifier"] == "doi"
+        assert entry_data.main_identifier == "doi"
 
         # Check identifiers exist - the exact structure will be tested in integration
-        assert "identifiers" in entry_data
-        assert isinstance(entry_data["identifiers"], dict)
+        assert isinstance(entry_data.identifiers, dict)
 
     def test_load_nonexistent_file(self):
         """Test loading a non-existent file raises FileNotFoundError."""
@@ -6,6 +6,7 @@ from .library import Library
 from .model import Entry
 
 def parse_file(file_path: str | Path) -> Library: ...
+def parse_string(bibtex_str: str) -> Library: ...
 def write_string(library: Library) -> str: ...
 
-__all__ = ["parse_file", "write_string", "Library", "Entry"]
+__all__ = ["parse_file", "parse_string", "write_string", "Library", "Entry"]
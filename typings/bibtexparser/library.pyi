@@ -14,7 +14,7 @@ class Library:
     failed_blocks: Sequence[Block]
 
     def __init__(self, blocks: Sequence[Block] | None = None) -> None: ...
-    def add(self, entry: Entry) -> None: ...
+    def add(self, blocks: Sequence[Block] | Block, fail_on_duplicate_key: bool = True) -> None: ...
     def remove(self, entry: Entry) -> None: ...
 
 __all__ = ["Library", "Block"]